@@ -0,0 +1,44 @@
+import os
+import sys
+import time
+import subprocess
+
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+ENTRY_POINTS = ["portfolio", "scroll", "linea", "gmx"]
+RUNS = int(os.environ.get("IMPORT_BENCHMARK_RUNS", "5"))
+
+_EAGER = "from modules import MODULES; [MODULES[name] for name in MODULES]"
+_LAZY = "from modules import MODULES; MODULES[{name!r}]"
+
+
+def _time_import(code: str) -> float:
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=ROOT,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    baseline = _time_import("pass")
+    eager = _time_import(_EAGER) - baseline
+    print(f"interpreter start: {baseline * 1000:.1f} ms (subtracted below)")
+    print(f"{'entry point':<12}{'eager (ms)':>12}{'lazy (ms)':>12}{'gain':>8}")
+    for name in ENTRY_POINTS:
+        lazy = _time_import(_LAZY.format(name=name)) - baseline
+        print(
+            f"{name:<12}{eager * 1000:>12.1f}{lazy * 1000:>12.1f}"
+            f"{eager / lazy if lazy > 0 else float('inf'):>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+import asyncio
+
+from asyncio import Future
+from bisect import bisect_right
 from decimal import Decimal
 
 from utils import CachedClass
@@ -7,10 +11,25 @@ from bitcoin.constants import ORDINALS
 from exceptions import NotExistError
 
 
+def _build_ordinal_index(
+    ordinals: dict[str, list[int]],
+) -> tuple[list[int], list[tuple[int, str]]]:
+    ranges = sorted(
+        (lower, upper, ordinal) for ordinal, (lower, upper) in ordinals.items()
+    )
+    return [lower for lower, _, _ in ranges], [
+        (upper, ordinal) for _, upper, ordinal in ranges
+    ]
+
+
+_ORDINAL_STARTS, _ORDINAL_RANGES = _build_ordinal_index(ORDINALS)
+
+
 def find_ordinal_by_inscription_id(inscription_id: int) -> str | None:
-    for ordinal in ORDINALS:
-        lower, upper = ORDINALS[ordinal]
-        if lower <= inscription_id <= upper:
+    i = bisect_right(_ORDINAL_STARTS, inscription_id) - 1
+    if i >= 0:
+        upper, ordinal = _ORDINAL_RANGES[i]
+        if inscription_id <= upper:
             return ordinal
 
 
@@ -18,14 +37,17 @@ class Bitcoin(metaclass=CachedClass):
     def __init__(self) -> None:
         self.hiro_client = HiroClient()
         self.mempool_client = MempoolClient()
+        self._wallet_ordinals: dict[str, Future] = {}
+
+    def clear_wallet_cache(self) -> None:
+        self._wallet_ordinals = {}
 
     async def get_wallet_balance(self, wallet_address: str) -> Decimal:
         return await self.mempool_client.get_wallet_balance(wallet_address)
 
-    async def get_wallet_ordinals(self, wallet_address: str) -> dict[str, int]:
-        inscriptions = await self.hiro_client.get_ordinals(wallet_address)
+    async def _get_wallet_ordinals(self, wallet_address: str) -> dict[str, int]:
         ordinals = {}
-        for inscription_id in inscriptions:
+        async for inscription_id in self.hiro_client.iter_ordinals(wallet_address):
             ordinal = find_ordinal_by_inscription_id(inscription_id)
             if ordinal in ordinals:
                 ordinals[ordinal] += 1
@@ -33,11 +55,19 @@ class Bitcoin(metaclass=CachedClass):
                 ordinals[ordinal] = 1
         return ordinals
 
+    async def get_wallet_ordinals(self, wallet_address: str) -> dict[str, int]:
+        if wallet_address not in self._wallet_ordinals:
+            self._wallet_ordinals[wallet_address] = asyncio.ensure_future(
+                self._get_wallet_ordinals(wallet_address)
+            )
+        try:
+            return await asyncio.shield(self._wallet_ordinals[wallet_address])
+        except BaseException:
+            self._wallet_ordinals.pop(wallet_address, None)
+            raise
+
     async def get_ordinal_balance(self, wallet_address: str, ordinal: str) -> int:
-        inscriptions = await self.hiro_client.get_ordinals(wallet_address)
-        balance = 0
-        lower, upper = ORDINALS[ordinal]
-        for inscription_id in inscriptions:
-            if lower <= inscription_id <= upper:
-                balance += 1
-        return balance
+        if ordinal not in ORDINALS:
+            raise NotExistError("ordinal", ordinal)
+        ordinals = await self.get_wallet_ordinals(wallet_address)
+        return ordinals.get(ordinal, 0)
@@ -1,3 +1,5 @@
+from typing import AsyncIterator
+
 from clients.http import HTTPClient
 
 
@@ -5,12 +7,37 @@ class HiroClient(HTTPClient):
     _name = "Hiro"
     _base_url = "https://api.hiro.so"
     _request_limit = 1
+    _page_size = 60
 
-    async def get_ordinals(self, wallet: str):
+    async def _get_page(self, wallet: str, offset: int) -> tuple[int, list[int]]:
         response = await self._call(
             "get",
             endpoint="/ordinals/v1/inscriptions",
-            parameters={"address": wallet},
+            parameters={
+                "address": wallet,
+                "limit": self._page_size,
+                "offset": offset,
+                "order_by": "number",
+                "order": "desc",
+            },
             headers={"Accept": "application/json"},
         )
-        return [inscription["number"] for inscription in response["results"]]
+        return response["total"], [
+            inscription["number"] for inscription in response["results"]
+        ]
+
+    async def iter_ordinals(self, wallet: str) -> AsyncIterator[int]:
+        fetched: set[int] = set()
+        offset = 0
+        while True:
+            total, numbers = await self._get_page(wallet, offset)
+            offset += len(numbers)
+            for number in numbers:
+                if number not in fetched:
+                    fetched.add(number)
+                    yield number
+            if len(numbers) == 0 or offset >= total:
+                break
+
+    async def get_ordinals(self, wallet: str) -> list[int]:
+        return [number async for number in self.iter_ordinals(wallet)]
@@ -1,3 +1,6 @@
+import asyncio
+
+from asyncio import Future, TimerHandle
 from typing import Any
 
 from state import RDS
@@ -7,16 +10,72 @@ from state.serializers import ColumnType
 
 class Cache:
     _data = {}
+    _persisted: set[str] = set()
+    _dirty: set[str] = set()
+    _pending: dict[str, list[Future]] = {}
+    _flush_handle: TimerHandle | None = None
     _table_name = "cache"
     _table_schema = {"cache_key": ColumnType.string, "cache_value": ColumnType.json}
+    _load_window = 0.01
+    _chunk_size = 100
 
     @staticmethod
-    def get(key) -> Any:
-        return Cache._data.get(key)
+    async def get(key) -> Any:
+        if key in Cache._data:
+            return Cache._data[key]
+        elif hasattr(Cache, "_state") and key in Cache._persisted:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            if key in Cache._pending:
+                Cache._pending[key].append(future)
+            else:
+                Cache._pending[key] = [future]
+            if len(Cache._pending) >= Cache._chunk_size:
+                Cache._flush()
+            elif Cache._flush_handle is None:
+                Cache._flush_handle = loop.call_later(Cache._load_window, Cache._flush)
+            return await future
 
     @staticmethod
     def put(key, value) -> None:
-        Cache._data[key] = value
+        if key not in Cache._data or Cache._data[key] != value:
+            Cache._data[key] = value
+            Cache._dirty.add(key)
+
+    @staticmethod
+    def _flush() -> None:
+        if Cache._flush_handle is not None:
+            Cache._flush_handle.cancel()
+            Cache._flush_handle = None
+        batch, Cache._pending = Cache._pending, {}
+        if len(batch) > 0:
+            asyncio.create_task(Cache._load(batch))
+
+    @staticmethod
+    async def _load(batch: dict[str, list[Future]]) -> None:
+        try:
+            table = await Cache._state.read(
+                Query.get_rows_in(
+                    Cache._table_name,
+                    "cache_key",
+                    list(batch),
+                    columns=["cache_key", "cache_value"],
+                )
+            )
+        except BaseException as error:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+            return
+        for key, value in zip(
+            table.get_column("cache_key"), table.get_column("cache_value")
+        ):
+            Cache._data.setdefault(key, value)
+        for key in batch:
+            for future in batch[key]:
+                if not future.done():
+                    future.set_result(Cache._data.get(key))
 
     @staticmethod
     async def read_from_state(state: RDS) -> None:
@@ -26,26 +85,31 @@ class Cache:
             await Cache._state.write(
                 Query.create_table(Cache._table_name, Cache._table_schema)
             )
-        Cache._table = await Cache._state.read(Query.get_table(Cache._table_name))
-        Cache._data = {
-            Cache._table.get_column("cache_key")[i]: Cache._table.get_column(
-                "cache_value"
-            )[i]
-            for i in range(Cache._table.row_count)
-        }
+        table = await Cache._state.read(
+            Query.get_table(Cache._table_name, columns=["cache_key"])
+        )
+        Cache._persisted = set(table.get_column("cache_key"))  # type: ignore
 
     @staticmethod
     async def save() -> None:
-        if hasattr(Cache, "_state") and hasattr(Cache, "_table"):
-            rows = [
-                [key, Cache._data[key]]
-                for key in Cache._data
-                if key not in Cache._table.get_column("cache_key")
-            ]
-            if len(rows) > 0:
+        if hasattr(Cache, "_state") and len(Cache._dirty) > 0:
+            dirty = [key for key in Cache._dirty if key in Cache._data]
+            changed = [key for key in dirty if key in Cache._persisted]
+            for i in range(0, len(changed), Cache._chunk_size):
                 await Cache._state.write(
-                    Query.insert_rows(Cache._table_name, ["cache_key", "cache_value"], rows)  # type: ignore
+                    Query.delete_rows_in(
+                        Cache._table_name,
+                        "cache_key",
+                        changed[i : i + Cache._chunk_size],  # type: ignore
+                    )
                 )
-                Cache._table = await Cache._state.read(
-                    Query.get_table(Cache._table_name)
+            for i in range(0, len(dirty), Cache._chunk_size):
+                rows = [
+                    [key, Cache._data[key]]
+                    for key in dirty[i : i + Cache._chunk_size]
+                ]
+                await Cache._state.write(
+                    Query.insert_rows(Cache._table_name, ["cache_key", "cache_value"], rows)  # type: ignore
                 )
+            Cache._persisted.update(dirty)
+            Cache._dirty.clear()
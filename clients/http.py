@@ -1,12 +1,13 @@
+from __future__ import annotations
+
 import httpx
 import json
 import asyncio
-import uuid
 
 from typing import Any, Literal
-from urllib.parse import urlencode
-from asyncio import Queue
+from urllib.parse import urlencode, urlparse
 
+from clients.limiter import RateLimiter
 from exceptions import HTTPException
 
 
@@ -14,10 +15,39 @@ class HTTPClient:
     _name: str  # override
     _base_url: str  # override
     _request_limit: float  # override
+    _burst: int = 1
+    _max_concurrency: int | None = None
+    _http2: bool = False  # requires httpx[http2]
+    _max_connections: int = 20
+    _max_keepalive_connections: int = 10
+    _keepalive_expiry: float = 30
+    __clients: list[HTTPClient] = []
 
     def __init__(self) -> None:
-        self.__queue = Queue()
-        self.__unblock()
+        self.__client: httpx.AsyncClient | None = None
+        HTTPClient.__clients.append(self)
+
+    @staticmethod
+    async def close_all() -> None:
+        await asyncio.gather(*[client.close() for client in HTTPClient.__clients])
+
+    async def close(self) -> None:
+        if self.__client is not None:
+            client = self.__client
+            self.__client = None
+            await client.aclose()
+
+    def __get_client(self) -> httpx.AsyncClient:
+        if self.__client is None or self.__client.is_closed:
+            self.__client = httpx.AsyncClient(
+                http2=self._http2,
+                limits=httpx.Limits(
+                    max_connections=self._max_connections,
+                    max_keepalive_connections=self._max_keepalive_connections,
+                    keepalive_expiry=self._keepalive_expiry,
+                ),
+            )
+        return self.__client
 
     async def _call(
         self,
@@ -28,17 +58,23 @@ class HTTPClient:
         headers: dict[str, str] = {},
         timeout: int = 15,
     ) -> Any:
-        await self.__queue.get()
-        asyncio.create_task(self.__start_counter())
-        return await self.__call(method, endpoint, parameters, data, headers, timeout)
+        async with self._limiter:
+            return await self.__call(
+                method, endpoint, parameters, data, headers, timeout
+            )
 
-    def __unblock(self) -> None:
-        if self.__queue.empty():
-            self.__queue.put_nowait(uuid.uuid4().hex)
+    @property
+    def _rate_limit_key(self) -> str:
+        return urlparse(self._base_url).netloc
 
-    async def __start_counter(self) -> None:
-        await asyncio.sleep(self._request_limit)
-        self.__unblock()
+    @property
+    def _limiter(self) -> RateLimiter:
+        return RateLimiter(
+            f"{self._name}:{self._rate_limit_key}",
+            self._request_limit,
+            burst=self._burst,
+            max_concurrency=self._max_concurrency,
+        )
 
     async def __call(
         self,
@@ -54,20 +90,19 @@ class HTTPClient:
             + endpoint
             + (f"?{urlencode(parameters)}" if parameters else "")
         )
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            kwargs = {}
-            if data:
-                kwargs["data"] = data
-            if headers:
-                kwargs["headers"] = headers
-            response = await getattr(client, method)(url, **kwargs)
-            if response.status_code != 200:
-                text = response.text
-                if "<!DOCTYPE html>" in text:
-                    raise HTTPException(
-                        self._name, response.status_code, "blocked by server"
-                    )
-                else:
-                    raise HTTPException(self._name, response.status_code, response.text)
-            data = json.loads(response.text)
-        return data
+        client = self.__get_client()
+        kwargs = {}
+        if data:
+            kwargs["data"] = data
+        if headers:
+            kwargs["headers"] = headers
+        response = await getattr(client, method)(url, timeout=timeout, **kwargs)
+        if response.status_code != 200:
+            text = response.text
+            if "<!DOCTYPE html>" in text:
+                raise HTTPException(
+                    self._name, response.status_code, "blocked by server"
+                )
+            else:
+                raise HTTPException(self._name, response.status_code, response.text)
+        return json.loads(response.text)
@@ -0,0 +1,66 @@
+import time
+import asyncio
+
+from asyncio import AbstractEventLoop, Lock, Semaphore
+
+from utils import CachedClass
+
+
+class RateLimiter(metaclass=CachedClass):
+    def __init__(
+        self,
+        key: str,
+        request_limit: float,
+        burst: int = 1,
+        max_concurrency: int | None = None,
+    ) -> None:
+        self.key = key
+        self.rate = 1 / request_limit if request_limit > 0 else float("inf")
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._loop: AbstractEventLoop | None = None
+        self._lock = Lock()
+        self._semaphore = Semaphore(max_concurrency) if max_concurrency else None
+
+    def __repr__(self) -> str:
+        return f"<RateLimiter {self.key} rate: {self.rate}/s burst: {self.burst}>"
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.burst, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _bind(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = Lock()
+            if self.max_concurrency:
+                self._semaphore = Semaphore(self.max_concurrency)
+
+    async def _take(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    async def __aenter__(self) -> None:
+        self._bind()
+        if self._semaphore:
+            await self._semaphore.acquire()
+        try:
+            await self._take()
+        except BaseException:
+            if self._semaphore:
+                self._semaphore.release()
+            raise
+
+    async def __aexit__(self, *_) -> None:
+        if self._semaphore:
+            self._semaphore.release()
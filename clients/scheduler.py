@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import httpx
+
+from asyncio import Future
+from collections import deque
+from typing import Any, Awaitable, Callable
+from urllib.parse import urlparse
+
+from utils import CachedClass
+
+
+def _status_code(error: BaseException) -> int | None:
+    if isinstance(getattr(error, "status", None), int):
+        return error.status  # type: ignore
+    response = getattr(error, "response", None)
+    if isinstance(getattr(response, "status_code", None), int):
+        return response.status_code  # type: ignore
+    return None
+
+
+def _is_throttled(error: BaseException | None) -> bool:
+    while error is not None:
+        if isinstance(
+            error, (asyncio.TimeoutError, TimeoutError, httpx.TimeoutException)
+        ):
+            return True
+        if _status_code(error) == 429 or "Too Many Requests" in str(error):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+class AdaptiveScheduler(metaclass=CachedClass):
+    _schedulers: list[AdaptiveScheduler] = []
+
+    @staticmethod
+    def get_all_stats() -> list[dict[str, Any]]:
+        return [scheduler.stats for scheduler in AdaptiveScheduler._schedulers]
+
+    def __init__(
+        self,
+        endpoint: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff: float = 0.5,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+    ) -> None:
+        self.endpoint = urlparse(endpoint).netloc or endpoint
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff = backoff
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.in_flight = 0
+        self._waiters: deque[Future] = deque()
+        AdaptiveScheduler._schedulers.append(self)
+
+    def __repr__(self) -> str:
+        return f"<AdaptiveScheduler {self.endpoint} limit: {int(self.limit)}>"
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+        }
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def _acquire(self) -> None:
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+    def _on_success(self) -> None:
+        self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+
+    def _on_throttled(self) -> None:
+        self.limit = max(self.min_limit, self.limit * self.backoff)
+
+    async def run(
+        self, function: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any
+    ) -> Any:
+        attempt = 0
+        while True:
+            await self._acquire()
+            try:
+                result = await function(*args, **kwargs)
+            except Exception as error:
+                if not _is_throttled(error) or attempt >= self.max_retries:
+                    raise
+                self._on_throttled()
+                attempt += 1
+            else:
+                self._on_success()
+                return result
+            finally:
+                self._release()
+            await asyncio.sleep(self.retry_delay * 2 ** (attempt - 1))
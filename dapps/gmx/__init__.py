@@ -2,9 +2,11 @@ import asyncio
 
 from decimal import Decimal
 
+from web3.types import BlockIdentifier
+
 from evm import EVM
 from utils import CachedClass
-from dapps.gmx.oracle import GMXOracle
+from dapps.gmx.oracle import GMXOracle, GMXPriceFeed
 from evm.constants import ABI, ADDRESSES
 from dapps.gmx.gm import SupportedMarkets, MARKETS
 from dapps.gmx.glv import SupportedGLV, GLV
@@ -33,12 +35,15 @@ class GMX(metaclass=CachedClass):
             ADDRESSES[chain.name]["vGMX"], ABI["StakedGMXTracker"]
         )
 
-    async def get_gm_withdraw_amount_out(
-        self, amount: Decimal, market: SupportedMarkets
+    async def _get_gm_withdraw_amount_out(
+        self,
+        amount: Decimal,
+        market: SupportedMarkets,
+        price_feed: GMXPriceFeed,
+        block_identifier: BlockIdentifier | None = None,
     ) -> tuple[Decimal, Decimal]:
         gm_market = MARKETS[self.chain.name][market]
         market_prop = gm_market["market_prop"]
-        price_feed = await self.oracle.get_price_feed()
         long, short = await self.gmx_reader.view(
             "getWithdrawalAmountOut",
             self.data_store,
@@ -46,11 +51,38 @@ class GMX(metaclass=CachedClass):
             price_feed.get_prices(market_prop),
             int(amount * Decimal(10**18)),
             self.gmx_ui_fee_receiver,
+            block_identifier=block_identifier,
         )
         return Decimal(long) / Decimal(10 ** gm_market["long_token_decimal"]), Decimal(
             short
         ) / Decimal(10 ** gm_market["short_token_decimal"])
 
+    async def get_gm_withdraw_amounts_out(
+        self,
+        quotes: list[tuple[Decimal, SupportedMarkets]],
+        block_identifier: BlockIdentifier | None = None,
+    ) -> list[tuple[Decimal, Decimal]]:
+        if len(quotes) == 0:
+            return []
+        price_feed = await self.oracle.get_price_feed()
+        unique_quotes = list(dict.fromkeys(quotes))
+        results = await asyncio.gather(
+            *[
+                self._get_gm_withdraw_amount_out(
+                    amount, market, price_feed, block_identifier
+                )
+                for amount, market in unique_quotes
+            ]
+        )
+        amounts_out = dict(zip(unique_quotes, results))
+        return [amounts_out[quote] for quote in quotes]
+
+    async def get_gm_withdraw_amount_out(
+        self, amount: Decimal, market: SupportedMarkets
+    ) -> tuple[Decimal, Decimal]:
+        (amount_out,) = await self.get_gm_withdraw_amounts_out([(amount, market)])
+        return amount_out
+
     async def get_gm_withdraw_amount_out_for_account(
         self, account: str, market: SupportedMarkets
     ) -> tuple[Decimal, Decimal]:
@@ -60,36 +92,69 @@ class GMX(metaclass=CachedClass):
         balance = await gm.get_balance(account)
         return await self.get_gm_withdraw_amount_out(balance, market)
 
-    async def get_glv_withdraw_amount_out(
-        self, amount: Decimal, glv: SupportedGLV
-    ) -> tuple[Decimal, Decimal]:
+    async def _get_glv_composition(
+        self, glv: SupportedGLV
+    ) -> tuple[int, list[tuple[int, SupportedMarkets]]]:
         contract = self.chain.get_contract(
             GLV[self.chain.name][glv]["address"], ABI["GLV"]
         )
-        total_supply = await contract.view("totalSupply")
         all_markets = GLV[self.chain.name][glv]["gm_markets"]
-        all_balances = await asyncio.gather(
+        total_supply, *all_balances = await asyncio.gather(
+            contract.view("totalSupply"),
             *[
                 contract.view(
                     "tokenBalances", MARKETS[self.chain.name][gm]["market_prop"][0]
                 )
                 for gm in all_markets
-            ]
+            ],
         )
-        all_withdraw_amount_out = await asyncio.gather(
-            *[
-                self.get_gm_withdraw_amount_out(
-                    Decimal(all_balances[i]) * amount / Decimal(total_supply),
-                    all_markets[i],
-                )
-                for i in range(len(all_markets))
+        return total_supply, [
+            (all_balances[i], all_markets[i]) for i in range(len(all_markets))
+        ]
+
+    async def get_withdraw_amounts_out(
+        self,
+        gm_quotes: list[tuple[Decimal, SupportedMarkets]],
+        glv_quotes: list[tuple[Decimal, SupportedGLV]],
+    ) -> tuple[list[tuple[Decimal, Decimal]], list[tuple[Decimal, Decimal]]]:
+        unique_glvs = list(dict.fromkeys([glv for _, glv in glv_quotes]))
+        compositions = dict(
+            zip(
+                unique_glvs,
+                await asyncio.gather(
+                    *[self._get_glv_composition(glv) for glv in unique_glvs]
+                ),
+            )
+        )
+        glv_gm_quotes = [
+            [
+                (Decimal(balance) * amount / Decimal(compositions[glv][0]), gm)
+                for balance, gm in compositions[glv][1]
             ]
+            for amount, glv in glv_quotes
+        ]
+        amounts_out = await self.get_gm_withdraw_amounts_out(
+            gm_quotes + [quote for quotes in glv_gm_quotes for quote in quotes]
         )
-        return sum(
-            [long_token_amount for long_token_amount, _ in all_withdraw_amount_out]
-        ), sum(
-            [short_token_amount for _, short_token_amount in all_withdraw_amount_out]
-        )  # type: ignore
+        gm_amounts_out = amounts_out[: len(gm_quotes)]
+        glv_amounts_out = []
+        i = len(gm_quotes)
+        for quotes in glv_gm_quotes:
+            constituents = amounts_out[i : i + len(quotes)]
+            glv_amounts_out.append(
+                (
+                    sum([long for long, _ in constituents], Decimal(0)),
+                    sum([short for _, short in constituents], Decimal(0)),
+                )
+            )
+            i += len(quotes)
+        return gm_amounts_out, glv_amounts_out
+
+    async def get_glv_withdraw_amount_out(
+        self, amount: Decimal, glv: SupportedGLV
+    ) -> tuple[Decimal, Decimal]:
+        _, (amount_out,) = await self.get_withdraw_amounts_out([], [(amount, glv)])
+        return amount_out
 
     async def get_glv_withdraw_amount_out_for_account(
         self, account: str, glv: SupportedGLV
@@ -1,3 +1,9 @@
+import time
+import asyncio
+
+from asyncio import Future
+from functools import cache
+
 from eth_utils.address import to_checksum_address
 from eth_typing import ChecksumAddress
 
@@ -5,27 +11,49 @@ from utils import CachedClass
 from clients.http import HTTPClient
 
 
+@cache
+def _checksum(token: str) -> ChecksumAddress:
+    return to_checksum_address(token)
+
+
 class GMXPriceFeed:
     def __init__(self, data: dict) -> None:
         self._data = data
+        self._prices: dict[tuple[str, ...], list[list]] = {}
 
     def get_prices(self, market_prop: list[str | ChecksumAddress]) -> list[list]:
-        return [
-            self._data[to_checksum_address(token)]["price_prop"]
-            for token in market_prop[1::]
-        ]
+        tokens = tuple(market_prop[1::])
+        if tokens not in self._prices:
+            self._prices[tokens] = [
+                self._data[_checksum(token)]["price_prop"] for token in tokens
+            ]
+        return self._prices[tokens]
 
 
 class GMXOracle(HTTPClient, metaclass=CachedClass):
     _name = "GMXPriceOracle"
     _base_url = "https://arbitrum-v2-1-api.gmxinfra.io"
     _request_limit = 0.1
+    _cache_ttl = 15
+    _pinned = False
 
-    async def get_price_feed(self) -> GMXPriceFeed:
+    def __init__(self) -> None:
+        super().__init__()
+        self._feed: tuple[float, Future] | None = None
+
+    def pin_feed(self) -> None:
+        GMXOracle._pinned = True
+        self._feed = None
+
+    def unpin_feed(self) -> None:
+        GMXOracle._pinned = False
+        self._feed = None
+
+    async def _get_price_feed(self) -> GMXPriceFeed:
         response = await self._call("get", "/signed_prices/latest")
         return GMXPriceFeed(
             {
-                to_checksum_address(token["tokenAddress"]): {
+                _checksum(token["tokenAddress"]): {
                     "price_prop": [
                         int(token["maxPriceFull"]),
                         int(token["minPriceFull"]),
@@ -35,3 +63,17 @@ class GMXOracle(HTTPClient, metaclass=CachedClass):
                 for token in response["signedPrices"]
             }
         )
+
+    async def get_price_feed(self) -> GMXPriceFeed:
+        now = time.monotonic()
+        if self._feed is None or (
+            not GMXOracle._pinned and now - self._feed[0] > self._cache_ttl
+        ):
+            self._feed = (now, asyncio.ensure_future(self._get_price_feed()))
+        fetched_at, feed = self._feed
+        try:
+            return await asyncio.shield(feed)
+        except BaseException:
+            if self._feed == (fetched_at, feed):
+                self._feed = None
+            raise
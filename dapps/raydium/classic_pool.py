@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 from decimal import Decimal
 
 from utils import InitializableClass, CachedClass, initialized_property
@@ -51,15 +53,17 @@ class RaydiumClassicPool(InitializableClass, metaclass=CachedClass):
         self, base_token: SPLToken, quote_token: SPLToken
     ) -> ClassicPool:
         if base_token.mint == self.base_mint and quote_token.mint == self.quote_mint:
-            base_reserve = await self.base_vault.get_data()
-            quote_reserve = await self.quote_vault.get_data()
+            base_reserve, quote_reserve = await asyncio.gather(
+                self.base_vault.get_data(), self.quote_vault.get_data()
+            )
             return ClassicPool(
                 base_reserve["amount"] / Decimal(10**base_token.decimals),
                 quote_reserve["amount"] / Decimal(10**quote_token.decimals),
             )
         elif base_token.mint == self.quote_mint and quote_token.mint == self.base_mint:
-            base_reserve = await self.quote_vault.get_data()
-            quote_reserve = await self.base_vault.get_data()
+            base_reserve, quote_reserve = await asyncio.gather(
+                self.quote_vault.get_data(), self.base_vault.get_data()
+            )
             return ClassicPool(
                 base_reserve["amount"] / Decimal(10**base_token.decimals),
                 quote_reserve["amount"] / Decimal(10**quote_token.decimals),
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import asyncio
-
 from decimal import Decimal
-from random import uniform
 
 from web3 import AsyncWeb3
+from web3.types import BlockIdentifier
 from eth_utils.address import to_checksum_address
 
 from evm.chains import get_chain_meta
 from evm.contract import Contract
+from evm.multicall import Multicall
+from evm.provider import BatchingHTTPProvider
 from evm.erc20 import ERC20
 from evm.erc1967 import ERC1967
 from evm.nft import ERC721
@@ -18,6 +18,14 @@ from utils import CachedClass
 
 
 class EVM(metaclass=CachedClass):
+    @staticmethod
+    def pin_blocks() -> None:
+        Multicall.pin_blocks()
+
+    @staticmethod
+    def unpin_blocks() -> None:
+        Multicall.unpin_blocks()
+
     @staticmethod
     def get_chain(name: str) -> EVM:
         network_id, rpc_url, symbol = get_chain_meta(name)
@@ -27,14 +35,32 @@ class EVM(metaclass=CachedClass):
         self.name = name
         self.network_id = network_id
         self.symbol = symbol
-        self.rpc = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        self.rpc = AsyncWeb3(BatchingHTTPProvider(rpc_url))
+        self.multicall = Multicall(network_id, self.rpc)
 
     def __repr__(self) -> str:
         return f"<EVM network_id: {self.network_id}>"
 
-    async def get_balance(self, address: str) -> Decimal:
-        await asyncio.sleep(uniform(0, 5))
-        wei = await self.rpc.eth.get_balance(to_checksum_address(address))
+    async def get_balance(
+        self, address: str, block_identifier: BlockIdentifier | None = None
+    ) -> Decimal:
+        checksum_address = to_checksum_address(address)
+        block = (
+            block_identifier
+            if block_identifier is not None
+            else await self.multicall.get_block_identifier()
+        )
+        if isinstance(block, int):
+            wei = await self.multicall.single_flight(
+                (block, "balance", checksum_address),
+                self.rpc.eth.get_balance,
+                checksum_address,
+                block_identifier=block,
+            )
+        else:
+            wei = await self.rpc.eth.get_balance(
+                checksum_address, block_identifier=block
+            )
         return Decimal(wei) / Decimal(10**18)
 
     def get_contract(self, address: str, abi: list) -> Contract:
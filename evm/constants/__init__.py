@@ -1,11 +1,18 @@
-from utils import get_json_dictionary
+from utils import LazyJSONDictionary
 from pathlib import Path
 
 
-ABI = get_json_dictionary(f"{Path(__file__).parent}/abis/")
+ABI = LazyJSONDictionary(
+    f"{Path(__file__).parent}/abis/", f"{Path(__file__).parent}/abis.marshal"
+)
 
-ADDRESSES = get_json_dictionary(f"{Path(__file__).parent}/addresses/")
+ADDRESSES = LazyJSONDictionary(
+    f"{Path(__file__).parent}/addresses/",
+    f"{Path(__file__).parent}/addresses.marshal",
+)
 
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 TOPIC_APPROVAL = "0x8c5be1e5ebec7d5bd14f71427d1e84f3dd0314c0f7b2291e5b200ac8c7c3b925"
@@ -0,0 +1,5 @@
+from evm.constants import ABI, ADDRESSES
+
+
+ABI.build_bundle()
+ADDRESSES.build_bundle()
@@ -1,14 +1,14 @@
 import hashlib
-import asyncio
 
-from random import uniform
 from typing import Any
 
 from web3 import AsyncWeb3
+from web3.types import BlockIdentifier
 from eth_typing.evm import ChecksumAddress
 
 from utils import CachedClass
 from cache import Cache
+from evm.multicall import Multicall
 
 
 def _serialize_cache(value: Any) -> list:
@@ -33,6 +33,7 @@ class Contract(metaclass=CachedClass):
         self.rpc = rpc
         self.address = address
         self.contract = rpc.eth.contract(address, abi=abi)
+        self.multicall = Multicall(network_id, rpc)
 
     def __repr__(self) -> str:
         return f"<Contract({self.address}) network_id: {self.network_id}>"
@@ -41,15 +42,24 @@ class Contract(metaclass=CachedClass):
         call_repr = f"{self.network_id}{self.address.lower()}{method}{args}".encode()
         return hashlib.sha256(call_repr).hexdigest()
 
-    async def _view(self, method, *args) -> Any:
-        await asyncio.sleep(uniform(0, 5))
-        return await getattr(self.contract.functions, method)(*args).call()
+    async def _view(
+        self, method, *args, block_identifier: BlockIdentifier | None = None
+    ) -> Any:
+        return await self.multicall.call(
+            getattr(self.contract.functions, method)(*args),
+            block_identifier=block_identifier,
+        )
 
     async def view(
-        self, method, *args, immutable: bool = False, override: bool = False
+        self,
+        method,
+        *args,
+        immutable: bool = False,
+        override: bool = False,
+        block_identifier: BlockIdentifier | None = None,
     ) -> Any:
         if not immutable:
-            return await self._view(method, *args)
+            return await self._view(method, *args, block_identifier=block_identifier)
         else:
             key = self._get_cache_key(method, *args)
             if override:
@@ -57,7 +67,7 @@ class Contract(metaclass=CachedClass):
                 Cache.put(key, _serialize_cache(value))
                 return value
             else:
-                value_from_cache = Cache.get(key)
+                value_from_cache = await Cache.get(key)
                 if value_from_cache == None:
                     value = await self._view(method, *args)
                     Cache.put(key, _serialize_cache(value))
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+
+from asyncio import Future, TimerHandle
+from typing import Any, Awaitable, Callable, Hashable
+
+from web3 import AsyncWeb3
+from web3.types import BlockIdentifier
+from web3.contract.async_contract import AsyncContractFunction
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+
+from utils import CachedClass
+from evm.constants import ABI, MULTICALL3_ADDRESS
+from exceptions import CallReverted
+
+
+def _decode_output(
+    rpc: AsyncWeb3, function: AsyncContractFunction, data: bytes
+) -> Any:
+    output_types = get_abi_output_types(function.abi)
+    output_data = rpc.codec.decode(output_types, data)
+    normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    else:
+        return normalized_data
+
+
+def _failed(future: Future) -> bool:
+    return future.cancelled() or future.exception() is not None
+
+
+class Multicall(metaclass=CachedClass):
+    _instances: list[Multicall] = []
+    _pinned = False
+
+    @staticmethod
+    def pin_blocks() -> None:
+        Multicall._pinned = True
+        for instance in Multicall._instances:
+            instance._reset_block()
+
+    @staticmethod
+    def unpin_blocks() -> None:
+        Multicall._pinned = False
+        for instance in Multicall._instances:
+            instance._reset_block()
+
+    def __init__(
+        self,
+        network_id: int,
+        rpc: AsyncWeb3,
+        window: float = 0.05,
+        max_batch_size: int = 50,
+    ) -> None:
+        self.network_id = network_id
+        self.rpc = rpc
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.contract = rpc.eth.contract(MULTICALL3_ADDRESS, abi=ABI["Multicall3"])
+        self._pending: list[tuple[AsyncContractFunction, BlockIdentifier, Future]] = []
+        self._flush_handle: TimerHandle | None = None
+        self._block: Future | None = None
+        self._results: dict[Hashable, Future] = {}
+        Multicall._instances.append(self)
+
+    def __repr__(self) -> str:
+        return f"<Multicall network_id: {self.network_id}>"
+
+    def _reset_block(self) -> None:
+        self._block = None
+        self._results = {}
+
+    def _forget_failed_block(self, future: Future) -> None:
+        if _failed(future) and self._block is future:
+            self._block = None
+
+    def _forget_failed_result(self, key: Hashable) -> Callable[[Future], None]:
+        def callback(future: Future) -> None:
+            if _failed(future) and self._results.get(key) is future:
+                del self._results[key]
+
+        return callback
+
+    async def get_block_identifier(self) -> BlockIdentifier:
+        if not Multicall._pinned:
+            return "latest"
+        if self._block is None:
+            self._block = asyncio.ensure_future(self.rpc.eth.block_number)
+            self._block.add_done_callback(self._forget_failed_block)
+        return await asyncio.shield(self._block)
+
+    async def single_flight(
+        self,
+        key: Hashable,
+        function: Callable[..., Awaitable[Any]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if not Multicall._pinned:
+            return await function(*args, **kwargs)
+        if key not in self._results:
+            self._results[key] = asyncio.ensure_future(function(*args, **kwargs))
+            self._results[key].add_done_callback(self._forget_failed_result(key))
+        return await asyncio.shield(self._results[key])
+
+    async def call(
+        self,
+        function: AsyncContractFunction,
+        block_identifier: BlockIdentifier | None = None,
+    ) -> Any:
+        block = (
+            block_identifier
+            if block_identifier is not None
+            else await self.get_block_identifier()
+        )
+        if isinstance(block, int):
+            key = (block, function.address, function._encode_transaction_data())
+            return await self.single_flight(key, self._enqueue, function, block)
+        else:
+            return await self._enqueue(function, block)
+
+    async def _enqueue(
+        self, function: AsyncContractFunction, block: BlockIdentifier
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((function, block, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        batches: dict[BlockIdentifier, list[tuple[AsyncContractFunction, Future]]] = {}
+        for function, block, future in batch:
+            batches.setdefault(block, []).append((function, future))
+        for block in batches:
+            asyncio.create_task(self._execute(batches[block], block))
+
+    async def _execute(
+        self,
+        batch: list[tuple[AsyncContractFunction, Future]],
+        block: BlockIdentifier,
+    ) -> None:
+        calls = [
+            (function.address, True, function._encode_transaction_data())
+            for function, _ in batch
+        ]
+        try:
+            results = await self.contract.functions.aggregate3(calls).call(
+                block_identifier=block
+            )
+        except BaseException as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for (function, future), (success, data) in zip(batch, results):
+            if future.done():
+                continue
+            if not success:
+                future.set_exception(
+                    CallReverted(function.address, function.fn_name, data)
+                )
+                continue
+            try:
+                future.set_result(_decode_output(self.rpc, function, data))
+            except Exception as error:
+                future.set_exception(error)
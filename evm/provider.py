@@ -0,0 +1,116 @@
+import json
+import asyncio
+
+from asyncio import Future, TimerHandle
+from typing import Any
+
+from web3 import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+from web3._utils.request import async_make_post_request
+from web3._utils.encoding import Web3JsonEncoder
+
+from clients.scheduler import AdaptiveScheduler
+
+
+BATCHED_METHODS = {"eth_call", "eth_getBalance", "eth_blockNumber"}
+
+
+class BatchingHTTPProvider(AsyncHTTPProvider):
+    def __init__(
+        self,
+        endpoint_uri: str,
+        max_batch_size: int = 20,
+        flush_delay: float = 0.01,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(endpoint_uri, **kwargs)
+        self.max_batch_size = max_batch_size
+        self.flush_delay = flush_delay
+        self.scheduler = AdaptiveScheduler(endpoint_uri)
+        self._pending: list[tuple[dict, Future]] = []
+        self._flush_handle: TimerHandle | None = None
+        self._batch_supported = True
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        if method not in BATCHED_METHODS or not self._batch_supported:
+            return await self.scheduler.run(super().make_request, method, params)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        request = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+        self._pending.append((request, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.flush_delay, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if len(batch) > 0:
+            asyncio.create_task(self._send(batch))
+
+    async def _post_batch(self, requests: list[dict]) -> list[RPCResponse]:
+        request_data = json.dumps(requests, cls=Web3JsonEncoder).encode()
+        raw_response = await async_make_post_request(
+            self.endpoint_uri, request_data, **self.get_request_kwargs()
+        )
+        return self.decode_rpc_response(raw_response)  # type: ignore
+
+    async def _request(self, request: dict) -> RPCResponse:
+        response = await self.scheduler.run(
+            super().make_request, request["method"], request["params"]
+        )
+        return {**response, "id": request["id"]}  # type: ignore
+
+    async def _send_each(self, batch: list[tuple[dict, Future]]) -> None:
+        results = await asyncio.gather(
+            *[self._request(request) for request, _ in batch],
+            return_exceptions=True,
+        )
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _send(self, batch: list[tuple[dict, Future]]) -> None:
+        try:
+            if len(batch) == 1 or not self._batch_supported:
+                await self._send_each(batch)
+                return
+            responses = await self.scheduler.run(
+                self._post_batch, [request for request, _ in batch]
+            )
+            if isinstance(responses, dict):
+                self._batch_supported = False
+                await self._send_each(batch)
+                return
+        except BaseException as error:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        responses_by_id = {response.get("id"): response for response in responses}
+        for request, future in batch:
+            if future.done():
+                continue
+            if request["id"] in responses_by_id:
+                future.set_result(responses_by_id[request["id"]])
+            else:
+                future.set_result(
+                    {
+                        "jsonrpc": "2.0",
+                        "id": request["id"],
+                        "error": {"code": -32603, "message": "missing batch response"},
+                    }
+                )
@@ -29,3 +29,17 @@ class HTTPException(BaseException):
 class InvalidValue(BaseException):
     def __init__(self, value_type: str, value: Any) -> None:
         super().__init__(ValueError(f"Invalid {value_type}: {value}"))
+
+
+class CallReverted(BaseException):
+    def __init__(self, contract: Any, method: str, data: bytes) -> None:
+        super().__init__(
+            Exception(f"{contract} call to {method} reverted: 0x{data.hex()}")
+        )
+
+
+class VerificationError(BaseException):
+    def __init__(self, name: str, error: Any) -> None:
+        super().__init__(
+            Exception(f"{name} verification failed, max relative error {error}")
+        )
@@ -6,14 +6,24 @@ import asyncio
 from modules import MODULES
 from state import RDS
 from cache import Cache
+from clients.http import HTTPClient
 
 
 async def main(module: str, method: str, args: str) -> dict | list:
-    rds = RDS(api_key=os.environ.get("STATE_KEY"))
-    await Cache.read_from_state(rds)
-    data = await getattr(MODULES[module](rds), method)(*args)
-    await Cache.save()
-    return {"success": True, "data": data}
+    try:
+        rds = RDS(
+            api_key=os.environ.get("STATE_KEY"),
+            database_path=os.environ.get("STATE_DATABASE_PATH"),
+        )
+        await Cache.read_from_state(rds)
+        try:
+            data = await getattr(MODULES[module](rds), method)(*args)
+            await Cache.save()
+        finally:
+            await rds.flush()
+        return {"success": True, "data": data}
+    finally:
+        await HTTPClient.close_all()
 
 
 def lambda_handler(event, _):
@@ -1,18 +1,37 @@
 import inspect
+import importlib
 
-from typing import Callable
+from collections.abc import Mapping
+from typing import Callable, Iterator
 
-from modules.portfolio import PortfolioModule
-from modules.scroll import ScrollMarksTracker
-from modules.linea import LineaPointsTracker
-from modules.gmx import GMXPerformanceTracker
 
-MODULES = {
-    "portfolio": PortfolioModule,
-    "scroll": ScrollMarksTracker,
-    "linea": LineaPointsTracker,
-    "gmx": GMXPerformanceTracker,
-}
+class ModuleRegistry(Mapping):
+    def __init__(self, paths: dict[str, str]) -> None:
+        self._paths = paths
+        self._modules: dict[str, type] = {}
+
+    def __getitem__(self, name: str) -> type:
+        if name not in self._modules:
+            module_path, class_name = self._paths[name].split(":")
+            module = importlib.import_module(module_path)
+            self._modules[name] = getattr(module, class_name)
+        return self._modules[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+MODULES = ModuleRegistry(
+    {
+        "portfolio": "modules.portfolio:PortfolioModule",
+        "scroll": "modules.scroll:ScrollMarksTracker",
+        "linea": "modules.linea:LineaPointsTracker",
+        "gmx": "modules.gmx:GMXPerformanceTracker",
+    }
+)
 
 
 def _get_method_annotation(method: Callable) -> str:
@@ -7,14 +7,14 @@ from datetime import datetime
 
 from state import RDS
 from state.sql import Query
-from state.serializers import ColumnType, serialize
+from state.serializers import ColumnType
 from evm import EVM
-from dapps.gmx.gm import SupportedMarkets
-from dapps.gmx.glv import SupportedGLV
-from modules.gmx.index import create_index
+from dapps.gmx.oracle import GMXOracle
+from modules.gmx.analytics import PerformanceData
 from modules.gmx.optimizer import OptimizedGMX
 from modules.gmx.constants import ALL_TRACKED_CHAINS, ALL_TRACKED_GM, ALL_TRACKED_GLV
 from web2.coingecko import CoinGecko
+from web2.cex.candles import CandleStore
 from visualization import Canvas
 
 
@@ -43,39 +43,28 @@ class GMXPerformanceTracker:
                 Query.create_table(self.table_name, self.table_schema)
             )
 
-    async def _track_gm(
-        self, chain: str, gm: SupportedMarkets, asset_amount: Decimal, timestamp: int
+    async def _track_chain(
+        self, chain: str, asset_amount: Decimal, timestamp: int
     ) -> None:
         gmx = OptimizedGMX(EVM.get_chain(chain))
-        long_token_withdraw_amount, short_token_withdraw_amount = (
-            await gmx.get_gm_withdraw_amount_out(asset_amount, gm)
+        all_gm = ALL_TRACKED_GM.get(chain, [])
+        all_glv = ALL_TRACKED_GLV.get(chain, [])
+        gm_amounts_out, glv_amounts_out = await gmx.get_withdraw_amounts_out(
+            [(asset_amount, gm) for gm in all_gm],
+            [(asset_amount, glv) for glv in all_glv],
         )
-        row = {
-            "timestamp": timestamp,
-            "chain": chain,
-            "asset": gm,
-            "asset_amount": asset_amount,
-            "long_token_withdraw_amount": long_token_withdraw_amount,
-            "short_token_withdraw_amount": short_token_withdraw_amount,
-        }
-        await self.state.write(Query.insert_row(self.table_name, row))
-
-    async def _track_glv(
-        self, chain: str, glv: SupportedGLV, asset_amount: Decimal, timestamp: int
-    ) -> None:
-        gmx = OptimizedGMX(EVM.get_chain(chain))
-        long_token_withdraw_amount, short_token_withdraw_amount = (
-            await gmx.get_glv_withdraw_amount_out(asset_amount, glv)
-        )
-        row = {
-            "timestamp": timestamp,
-            "chain": chain,
-            "asset": glv,
-            "asset_amount": asset_amount,
-            "long_token_withdraw_amount": long_token_withdraw_amount,
-            "short_token_withdraw_amount": short_token_withdraw_amount,
-        }
-        await self.state.write(Query.insert_row(self.table_name, row))
+        for asset, (long_token_withdraw_amount, short_token_withdraw_amount) in zip(
+            [*all_gm, *all_glv], [*gm_amounts_out, *glv_amounts_out]
+        ):
+            row = {
+                "timestamp": timestamp,
+                "chain": chain,
+                "asset": asset,
+                "asset_amount": asset_amount,
+                "long_token_withdraw_amount": long_token_withdraw_amount,
+                "short_token_withdraw_amount": short_token_withdraw_amount,
+            }
+            await self.state.insert_row(self.table_name, row)
 
     async def track_performance(self, asset_amount: str) -> None:
         timestamp = int(time.time())
@@ -94,20 +83,29 @@ class GMXPerformanceTracker:
                 ],
             )
         )
-        gm_tasks = []
-        for chain in ALL_TRACKED_CHAINS:
-            gm_tasks += [
-                self._track_gm(chain, gm, Decimal(asset_amount), timestamp)
-                for gm in ALL_TRACKED_GM[chain]
-            ]
-        await asyncio.gather(*gm_tasks)
-        glv_tasks = []
-        for chain in ALL_TRACKED_GLV:
-            glv_tasks += [
-                self._track_glv(chain, glv, Decimal(asset_amount), timestamp)
-                for glv in ALL_TRACKED_GLV[chain]
-            ]
-        await asyncio.gather(*glv_tasks)
+        GMXOracle().pin_feed()
+        try:
+            await asyncio.gather(
+                *[
+                    self._track_chain(chain, Decimal(asset_amount), timestamp)
+                    for chain in dict.fromkeys([*ALL_TRACKED_CHAINS, *ALL_TRACKED_GLV])
+                ]
+            )
+        finally:
+            GMXOracle().unpin_feed()
+
+    async def sync_candles(
+        self, ticker: str, interval: str, start_time: str, end_time: str = ""
+    ) -> None:
+        candle_store = CandleStore(self.state)
+        await candle_store.initialize_table()
+        count = await candle_store.sync(
+            ticker,
+            interval,
+            int(start_time),
+            int(end_time) if end_time else int(time.time() * 1000),
+        )
+        print(f"{count} new {interval} candles stored for {ticker}")
 
     async def get_asset_performance(self, chain: str, asset: str) -> None:
         table = await self.state.read(
@@ -119,148 +117,75 @@ class GMXPerformanceTracker:
         )
         print(table)
 
-    async def _plot_dual_exposure_asset(
-        self, canvas: Canvas, chain: str, asset: str, principal: str, weight: str
+    def _plot_dual_exposure_asset(
+        self,
+        canvas: Canvas,
+        data: PerformanceData,
+        chain: str,
+        asset: str,
+        principal: str,
+        weight: str,
     ) -> None:
-        table = await self.state.read(
-            Query(
-                """
-                SELECT
-                    gm.timestamp,
-                    gm.asset_amount,
-                    gm.long_token_withdraw_amount AS principal_amount,
-                    gm.short_token_withdraw_amount AS usd_amount,
-                    principal.short_token_withdraw_amount AS price
-                FROM
-                    gmx_performance_tracker gm
-                JOIN
-                    gmx_performance_tracker principal
-                ON
-                    gm.timestamp = principal.timestamp
-                WHERE
-                    gm.chain = {chain}
-                AND
-                    gm.asset = {gm_asset}
-                AND
-                    principal.asset = {principal_asset}
-                ORDER BY gm.timestamp ASC
-                """.format(
-                    chain=serialize(chain),
-                    gm_asset=serialize(asset),
-                    principal_asset=serialize(principal),
-                )
-            )
-        )
-        asset_usd_value = [
-            (
-                table.get_column("principal_amount")[i] * table.get_column("price")[i]  # type: ignore
-                + table.get_column("usd_amount")[i]
-            )
-            / table.get_column("asset_amount")[i]
-            for i in range(table.row_count)
-        ]
-        asset_performance = [value / asset_usd_value[0] for value in asset_usd_value]  # type: ignore
-        index_performance = create_index(Decimal(weight), table.get_column("price"))  # type: ignore
-        data = [
+        exposure = data.dual_exposure(chain, asset, principal, Decimal(weight))
+        chart_data = [
             ["timestamp", "Asset Performance", "Index Performance"],
             *[
                 [
-                    datetime.fromtimestamp(table.get_column("timestamp")[i]).strftime(  # type: ignore
-                        DATETIME_FORMAT
-                    ),
-                    float(asset_performance[i]),
-                    float(index_performance[i]),
+                    datetime.fromtimestamp(timestamp).strftime(DATETIME_FORMAT),
+                    float(asset_performance),
+                    float(index_performance),
                 ]
-                for i in range(table.row_count)
+                for timestamp, asset_performance, index_performance in zip(
+                    exposure.timestamp,
+                    exposure.asset_performance,
+                    exposure.index_performance,
+                )
             ],
         ]
-        timestamp_diff = (
-            table.get_column("timestamp")[-1] - table.get_column("timestamp")[0]
-        )  # type: ignore
-        apy = round(
-            (float(asset_performance[-1] / index_performance[-1]) - 1)  # type: ignore
-            * (365 * 24 * 60 * 60 / timestamp_diff)
-            * 100,
-            2,
-        )
-        days = days = int(timestamp_diff / (24 * 60 * 60))
         canvas.add_chart(
             "AreaChart",
-            f"{asset} (outperformance over index {days} days prorated APY {apy}%)",
-            data,
+            f"{asset} (outperformance over index {exposure.days} days prorated APY {exposure.apy}%)",
+            chart_data,
         )
 
-    async def _plot_single_exposure_asset(
-        self, canvas: Canvas, chain: str, asset: str
+    def _plot_single_exposure_asset(
+        self, canvas: Canvas, data: PerformanceData, chain: str, asset: str
     ) -> None:
-        table = await self.state.read(
-            Query.get_table(
-                self.table_name,
-                columns=[
-                    "timestamp",
-                    "asset_amount",
-                    "long_token_withdraw_amount",
-                    "short_token_withdraw_amount",
-                ],
-                match_values={"chain": chain, "asset": asset},
-                order_by="timestamp",
-            )
-        )
-        timestamp: list[int] = table.get_column("timestamp")  # type: ignore
-        asset_amount: list[Decimal] = table.get_column("asset_amount")  # type: ignore
-        long_token_withdraw_amount: list[Decimal] = table.get_column(
-            "long_token_withdraw_amount"
-        )  # type: ignore
-        short_token_withdraw_amount: list[Decimal] = table.get_column(
-            "short_token_withdraw_amount"
-        )  # type: ignore
-        first = (
-            long_token_withdraw_amount[0] + short_token_withdraw_amount[0]
-        ) / asset_amount[0]
-        last = (
-            long_token_withdraw_amount[-1] + short_token_withdraw_amount[-1]
-        ) / asset_amount[-1]
-        apy = round(
-            float((last - first) / first)
-            * (365 * 24 * 60 * 60 / (timestamp[-1] - timestamp[0]))
-            * 100,
-            2,
-        )
-        days = int((timestamp[-1] - timestamp[0]) / (24 * 60 * 60))
+        exposure = data.single_exposure(chain, asset)
         underlying = asset.split("-")[-1]
-        data = [
+        chart_data = [
             ["timestamp", f"{underlying} / {asset}"],
             *[
                 [
-                    datetime.fromtimestamp(timestamp[i]).strftime(DATETIME_FORMAT),
-                    float(
-                        (long_token_withdraw_amount[i] + short_token_withdraw_amount[i])
-                        / asset_amount[i]
-                    ),
+                    datetime.fromtimestamp(timestamp).strftime(DATETIME_FORMAT),
+                    float(value),
                 ]
-                for i in range(table.row_count)
+                for timestamp, value in zip(exposure.timestamp, exposure.value)
             ],
         ]
         canvas.add_chart(
-            "AreaChart", f"{asset} porformance ({days} days prorated APY {apy}%)", data
+            "AreaChart",
+            f"{asset} porformance ({exposure.days} days prorated APY {exposure.apy}%)",
+            chart_data,
         )
 
     async def plot_single_exposure_asset(self, chain: str, *assets: str) -> None:
         canvas = Canvas()
-        await asyncio.gather(
-            *[
-                self._plot_single_exposure_asset(canvas, chain, asset)
-                for asset in assets
-            ]
-        )
+        data = await PerformanceData.load(self.state, self.table_name, list(assets))
+        for asset in assets:
+            self._plot_single_exposure_asset(canvas, data, chain, asset)
         canvas.draw()
 
     async def plot_dual_exposure_asset(self, chain: str, *assets: str) -> None:
         canvas = Canvas()
-        await asyncio.gather(
-            *[
-                self._plot_dual_exposure_asset(canvas, chain, *asset.split(":"))
-                for asset in assets
-            ]
+        specs = [asset.split(":") for asset in assets]
+        data = await PerformanceData.load(
+            self.state,
+            self.table_name,
+            [name for asset, principal, _ in specs for name in (asset, principal)],
         )
+        for asset, principal, weight in specs:
+            self._plot_dual_exposure_asset(
+                canvas, data, chain, asset, principal, weight
+            )
         canvas.draw()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from state import RDS
+from state.sql import Query
+from state.table import Table
+from modules.gmx.index import create_index
+
+
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+class PerformanceSeries:
+    def __init__(self) -> None:
+        self.timestamp: list[int] = []
+        self.asset_amount: list[Decimal] = []
+        self.long_token_withdraw_amount: list[Decimal] = []
+        self.short_token_withdraw_amount: list[Decimal] = []
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def append(
+        self, timestamp: int, asset_amount: Decimal, long: Decimal, short: Decimal
+    ) -> None:
+        self.timestamp.append(timestamp)
+        self.asset_amount.append(asset_amount)
+        self.long_token_withdraw_amount.append(long)
+        self.short_token_withdraw_amount.append(short)
+
+    @property
+    def days(self) -> int:
+        return int((self.timestamp[-1] - self.timestamp[0]) / SECONDS_PER_DAY)
+
+    def prorate(self, growth: float) -> float:
+        timestamp_diff = self.timestamp[-1] - self.timestamp[0]
+        return round(growth * (SECONDS_PER_YEAR / timestamp_diff) * 100, 2)
+
+
+class SingleExposure:
+    def __init__(self, series: PerformanceSeries) -> None:
+        self.timestamp = series.timestamp
+        self.value = [
+            (long + short) / amount
+            for long, short, amount in zip(
+                series.long_token_withdraw_amount,
+                series.short_token_withdraw_amount,
+                series.asset_amount,
+            )
+        ]
+        self.days = series.days
+        self.apy = series.prorate(float((self.value[-1] - self.value[0]) / self.value[0]))
+
+
+class DualExposure:
+    def __init__(
+        self, series: PerformanceSeries, prices: dict[int, Decimal], weight: Decimal
+    ) -> None:
+        joined = PerformanceSeries()
+        price: list[Decimal] = []
+        for i, timestamp in enumerate(series.timestamp):
+            if timestamp in prices:
+                joined.append(
+                    timestamp,
+                    series.asset_amount[i],
+                    series.long_token_withdraw_amount[i],
+                    series.short_token_withdraw_amount[i],
+                )
+                price.append(prices[timestamp])
+        usd_value = [
+            (principal_amount * principal_price + usd_amount) / amount
+            for principal_amount, principal_price, usd_amount, amount in zip(
+                joined.long_token_withdraw_amount,
+                price,
+                joined.short_token_withdraw_amount,
+                joined.asset_amount,
+            )
+        ]
+        self.timestamp = joined.timestamp
+        self.asset_performance = [value / usd_value[0] for value in usd_value]
+        self.index_performance = create_index(weight, price)
+        self.days = joined.days
+        self.apy = joined.prorate(
+            float(self.asset_performance[-1] / self.index_performance[-1]) - 1
+        )
+
+
+class PerformanceData:
+    _columns = [
+        "timestamp",
+        "chain",
+        "asset",
+        "asset_amount",
+        "long_token_withdraw_amount",
+        "short_token_withdraw_amount",
+    ]
+
+    @staticmethod
+    async def load(state: RDS, table_name: str, assets: list[str]) -> PerformanceData:
+        table = await state.read(
+            Query.get_rows_in(
+                table_name,
+                "asset",
+                list(dict.fromkeys(assets)),  # type: ignore
+                columns=PerformanceData._columns,
+            )
+        )
+        return PerformanceData(table)
+
+    def __init__(self, table: Table) -> None:
+        self._series: dict[tuple[str, str], PerformanceSeries] = {}
+        self._prices: dict[str, dict[int, Decimal]] = {}
+        rows = sorted(
+            zip(*[table.get_column(column) for column in self._columns]),
+            key=lambda row: row[0],  # type: ignore
+        )
+        for timestamp, chain, asset, asset_amount, long, short in rows:
+            series = self._series.setdefault((chain, asset), PerformanceSeries())  # type: ignore
+            series.append(timestamp, asset_amount, long, short)  # type: ignore
+            self._prices.setdefault(asset, {})[timestamp] = short  # type: ignore
+
+    def get_series(self, chain: str, asset: str) -> PerformanceSeries:
+        return self._series.get((chain, asset), PerformanceSeries())
+
+    def single_exposure(self, chain: str, asset: str) -> SingleExposure:
+        return SingleExposure(self.get_series(chain, asset))
+
+    def dual_exposure(
+        self, chain: str, asset: str, principal: str, weight: Decimal
+    ) -> DualExposure:
+        return DualExposure(
+            self.get_series(chain, asset), self._prices.get(principal, {}), weight
+        )
@@ -1,30 +1,200 @@
 import hashlib
 
+from bisect import bisect_left
+from collections import OrderedDict
 from decimal import Decimal
 
+from web3.types import BlockIdentifier
+
 from dapps.gmx import GMX
 from dapps.gmx.gm import SupportedMarkets
 from evm import EVM
+from exceptions import InvalidValue
+
+
+AmountOut = tuple[Decimal, Decimal]
+
+
+def _midpoint(segment: tuple[Decimal, Decimal]) -> Decimal:
+    return (segment[0] + segment[1]) / 2
+
+
+def _sample_amounts(low: Decimal, high: Decimal, samples: int) -> list[Decimal]:
+    if low == high or samples < 2:
+        return sorted({low, high})
+    step = (high - low) / (samples - 1)
+    return [low + step * i for i in range(samples - 1)] + [high]
+
+
+def _relative_error(actual: Decimal, estimate: Decimal) -> Decimal:
+    if actual == 0:
+        return Decimal(0) if estimate == 0 else Decimal(1)
+    return abs(estimate - actual) / abs(actual)
+
+
+def _segment_error(
+    points: dict[Decimal, AmountOut], segment: tuple[Decimal, Decimal]
+) -> Decimal:
+    low_long, low_short = points[segment[0]]
+    high_long, high_short = points[segment[1]]
+    long, short = points[_midpoint(segment)]
+    return max(
+        _relative_error(long, (low_long + high_long) / 2),
+        _relative_error(short, (low_short + high_short) / 2),
+    )
+
+
+class WithdrawalCurve:
+    def __init__(
+        self,
+        points: dict[Decimal, AmountOut],
+        amounts: list[Decimal],
+        error: Decimal,
+    ) -> None:
+        low, high = min(amounts), max(amounts)
+        self._amounts = sorted([amount for amount in points if low <= amount <= high])
+        self._points = {amount: points[amount] for amount in self._amounts}
+        self.amounts = amounts
+        self.error = error
+        self.amounts_out = [self.get_amount_out(amount) for amount in amounts]
+
+    def __repr__(self) -> str:
+        return f"<WithdrawalCurve samples: {len(self._amounts)} error: {self.error}>"
+
+    def get_amount_out(self, amount: Decimal) -> AmountOut:
+        if amount in self._points:
+            return self._points[amount]
+        i = bisect_left(self._amounts, amount)
+        if i == 0 or i == len(self._amounts):
+            raise InvalidValue("amount", amount)
+        low, high = self._amounts[i - 1], self._amounts[i]
+        weight = (amount - low) / (high - low)
+        low_long, low_short = self._points[low]
+        high_long, high_short = self._points[high]
+        return (
+            low_long + (high_long - low_long) * weight,
+            low_short + (high_short - low_short) * weight,
+        )
 
 
 class OptimizedGMX(GMX):
+    _curve_samples = 5
+    _curve_tolerance = Decimal("0.0005")
+    _curve_max_refinements = 3
+    _curve_cache_size = 64
+
     def __init__(self, chain: EVM) -> None:
         super().__init__(chain)
         self._cache: dict[str, tuple[Decimal, Decimal, Decimal]] = {}
+        self._curves: OrderedDict[tuple[str, str, int], dict[Decimal, AmountOut]] = (
+            OrderedDict()
+        )
+
+    def _get_key(self, market: SupportedMarkets) -> str:
+        return hashlib.sha256(f"{self.chain.name}{market}".encode()).hexdigest()
 
-    async def get_gm_withdraw_amount_out(
-        self, amount: Decimal, market: SupportedMarkets
-    ) -> tuple[Decimal, Decimal]:
-        key = hashlib.sha256(f"{self.chain.name}{market}".encode()).hexdigest()
-        if key not in self._cache:
-            long_token_amount, short_token_amount = (
-                await super().get_gm_withdraw_amount_out(amount, market)
+    async def get_gm_withdraw_amounts_out(
+        self,
+        quotes: list[tuple[Decimal, SupportedMarkets]],
+        block_identifier: BlockIdentifier | None = None,
+    ) -> list[AmountOut]:
+        missing: dict[SupportedMarkets, Decimal] = {}
+        for amount, market in quotes:
+            if self._get_key(market) not in self._cache:
+                missing.setdefault(market, amount)
+        results = await super().get_gm_withdraw_amounts_out(
+            [(amount, market) for market, amount in missing.items()],
+            block_identifier,
+        )
+        for (market, amount), (long_token_amount, short_token_amount) in zip(
+            missing.items(), results
+        ):
+            self._cache[self._get_key(market)] = (
+                long_token_amount,
+                short_token_amount,
+                amount,
             )
-            self._cache[key] = (long_token_amount, short_token_amount, amount)
-            return long_token_amount, short_token_amount
+        amounts_out = []
+        for amount, market in quotes:
+            long_token_amount, short_token_amount, reference_amount = self._cache[
+                self._get_key(market)
+            ]
+            amounts_out.append(
+                (
+                    long_token_amount * amount / reference_amount,
+                    short_token_amount * amount / reference_amount,
+                )
+            )
+        return amounts_out
+
+    async def _get_curve_block(self) -> int:
+        block = await self.chain.multicall.get_block_identifier()
+        if isinstance(block, int):
+            return block
+        return await self.chain.rpc.eth.block_number
+
+    def _get_curve_points(
+        self, market: SupportedMarkets, block: int
+    ) -> dict[Decimal, AmountOut]:
+        key = (self.chain.name, market, block)
+        if key in self._curves:
+            self._curves.move_to_end(key)
         else:
-            long_token_amount, short_token_amount, reference_amount = self._cache[key]
-            return (
-                long_token_amount * amount / reference_amount,
-                short_token_amount * amount / reference_amount,
+            self._curves[key] = {}
+            if len(self._curves) > self._curve_cache_size:
+                self._curves.popitem(last=False)
+        return self._curves[key]
+
+    async def _quote_curve_points(
+        self,
+        market: SupportedMarkets,
+        points: dict[Decimal, AmountOut],
+        amounts: list[Decimal],
+        block: int,
+    ) -> None:
+        missing = [amount for amount in dict.fromkeys(amounts) if amount not in points]
+        results = await super().get_gm_withdraw_amounts_out(
+            [(amount, market) for amount in missing], block
+        )
+        points.update(zip(missing, results))
+
+    async def get_withdrawal_curve(
+        self,
+        market: SupportedMarkets,
+        amounts: list[Decimal],
+        samples: int | None = None,
+        tolerance: Decimal | None = None,
+    ) -> WithdrawalCurve:
+        if len(amounts) == 0:
+            raise InvalidValue("amounts", amounts)
+        samples = samples if samples is not None else self._curve_samples
+        tolerance = tolerance if tolerance is not None else self._curve_tolerance
+        block = await self._get_curve_block()
+        points = self._get_curve_points(market, block)
+        grid = _sample_amounts(min(amounts), max(amounts), samples)
+        segments = list(zip(grid, grid[1::]))
+        await self._quote_curve_points(
+            market, points, grid + [_midpoint(segment) for segment in segments], block
+        )
+        error = Decimal(0)
+        for refinement in range(self._curve_max_refinements + 1):
+            errors = [_segment_error(points, segment) for segment in segments]
+            if refinement == self._curve_max_refinements:
+                error = max([error, *errors])
+                break
+            error = max([error, *[value for value in errors if value <= tolerance]])
+            segments = [
+                half
+                for segment, segment_error in zip(segments, errors)
+                if segment_error > tolerance
+                for half in [
+                    (segment[0], _midpoint(segment)),
+                    (_midpoint(segment), segment[1]),
+                ]
+            ]
+            if len(segments) == 0:
+                break
+            await self._quote_curve_points(
+                market, points, [_midpoint(segment) for segment in segments], block
             )
+        return WithdrawalCurve(points, amounts, error)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Sequence
+
+import numpy as np
+
+from exceptions import InvalidValue, VerificationError
+
+
+RebalanceSchedule = int | Sequence[bool] | None
+
+DEFAULT_TOLERANCE = 1e-9
+
+
+def rebalance_mask(length: int, schedule: RebalanceSchedule = 1) -> np.ndarray:
+    if schedule is None:
+        mask = np.zeros(length, dtype=bool)
+    elif isinstance(schedule, int):
+        if schedule < 1:
+            raise InvalidValue("rebalance schedule", schedule)
+        mask = np.arange(length) % schedule == 0
+    else:
+        mask = np.array(schedule, dtype=bool)
+        if mask.shape != (length,):
+            raise InvalidValue("rebalance schedule", schedule)
+    if length > 0:
+        mask[0] = True
+    return mask
+
+
+def interval_schedule(timestamps: Sequence[int], interval: int) -> np.ndarray:
+    buckets = np.asarray(timestamps, dtype=np.int64) // interval
+    mask = np.ones(len(buckets), dtype=bool)
+    mask[1:] = buckets[1:] != buckets[:-1]
+    return mask
+
+
+def _verify(
+    name: str, values: np.ndarray, reference: list[Decimal], tolerance: float
+) -> None:
+    errors = [
+        abs(Decimal(float(value)) - expected) / abs(expected)
+        for value, expected in zip(values, reference)
+        if expected != 0
+    ]
+    max_error = max(errors, default=Decimal(0))
+    if max_error > Decimal(tolerance):
+        raise VerificationError(name, max_error)
+
+
+def _reference_constant_product_index(
+    weight: Decimal, prices: list[Decimal]
+) -> list[Decimal]:
+    k = (Decimal("1") - weight) ** 2 / prices[0]
+    return [Decimal("2") * (p * k) ** Decimal("0.5") for p in prices]
+
+
+def constant_product_index(
+    weight: float,
+    prices: Sequence[float] | np.ndarray,
+    verify: bool = False,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> np.ndarray:
+    prices = np.asarray(prices, dtype=np.float64)
+    k = (1 - weight) ** 2 / prices[0]
+    values = 2 * np.sqrt(prices * k)
+    if verify:
+        _verify(
+            "constant product index",
+            values,
+            _reference_constant_product_index(
+                Decimal(weight), [Decimal(price) for price in prices.tolist()]
+            ),
+            tolerance,
+        )
+    return values
+
+
+def _is_valid(value: float) -> bool:
+    return value == value and 0 < value < float("inf")
+
+
+def _reference_market_cap_index(
+    prices: np.ndarray,
+    market_caps: np.ndarray,
+    cash_percentage: Decimal,
+    mask: np.ndarray,
+) -> list[Decimal]:
+    values = []
+    value = Decimal(1)
+    cash = value
+    units: dict[int, Decimal] = {}
+    for t in range(prices.shape[0]):
+        row = prices[t].tolist()
+        if t > 0:
+            value = cash + sum(
+                [
+                    units[asset] * Decimal(row[asset])
+                    for asset in units
+                    if row[asset] == row[asset]
+                ],
+                Decimal(0),
+            )
+        if mask[t]:
+            caps = {
+                asset: Decimal(cap)
+                for asset, cap in enumerate(market_caps[t].tolist())
+                if _is_valid(cap) and _is_valid(row[asset])
+            }
+            total_cap = sum(caps.values(), Decimal(0))
+            invested = value * (1 - cash_percentage) if total_cap > 0 else Decimal(0)
+            cash = value - invested
+            units = {
+                asset: invested * caps[asset] / total_cap / Decimal(row[asset])
+                for asset in caps
+            }
+        values.append(value)
+    return values
+
+
+def market_cap_index(
+    prices: Sequence[Sequence[float]] | np.ndarray,
+    market_caps: Sequence[Sequence[float]] | np.ndarray,
+    cash_percentage: float,
+    schedule: RebalanceSchedule = 1,
+    verify: bool = False,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> np.ndarray:
+    prices = np.asarray(prices, dtype=np.float64)
+    market_caps = np.asarray(market_caps, dtype=np.float64)
+    if prices.ndim != 2 or prices.shape != market_caps.shape:
+        raise InvalidValue("market data shape", (prices.shape, market_caps.shape))
+    length = prices.shape[0]
+    if length == 0:
+        return np.zeros(0)
+    mask = rebalance_mask(length, schedule)
+    with np.errstate(invalid="ignore"):
+        valid = (
+            np.isfinite(prices)
+            & (prices > 0)
+            & np.isfinite(market_caps)
+            & (market_caps > 0)
+        )
+    caps = np.where(valid, market_caps, 0.0)
+    total_caps = caps.sum(axis=1, keepdims=True)
+    weights = np.divide(caps, total_caps, out=np.zeros_like(caps), where=total_caps > 0)
+    last_rebalance = np.maximum.accumulate(np.where(mask, np.arange(length), 0))
+    previous = np.concatenate([[0], last_rebalance[:-1]])
+    held = weights[previous]
+    ratio = np.divide(
+        np.nan_to_num(prices, nan=0.0),
+        prices[previous],
+        out=np.zeros_like(prices),
+        where=held > 0,
+    )
+    invested = (1 - cash_percentage) * held.sum(axis=1)
+    relative = 1 - invested + (1 - cash_percentage) * (held * ratio).sum(axis=1)
+    relative[0] = 1.0
+    growth = np.where(mask, relative, 1.0)
+    values = np.cumprod(growth)[previous] * relative
+    if verify:
+        _verify(
+            "market cap index",
+            values,
+            _reference_market_cap_index(
+                prices, market_caps, Decimal(cash_percentage), mask
+            ),
+            tolerance,
+        )
+    return values
@@ -12,8 +12,16 @@ from utils import dict_add, to_json
 from state import RDS
 from state.sql import Query
 from state.serializers import ColumnType
+from evm import EVM
+from bitcoin import Bitcoin
+from dapps.gmx.oracle import GMXOracle
+from web2.cex.binance import Binance
 from modules.portfolio.display import print_snapshot_report
-from modules.portfolio.context import btc_price, eth_price, sol_price
+from modules.portfolio.context import (
+    clear_coingecko_token_data,
+    resolve_coingecko_token_data,
+    coingecko_token_data,
+)
 from modules.portfolio.trackers.coin_tracker import CoinTracker
 from modules.portfolio.trackers.compound_tracker import CompoundTracker
 from modules.portfolio.trackers.aave_tracker import AaveTracker
@@ -26,7 +34,6 @@ from modules.portfolio.trackers.benddao_ape_staking_tracker import (
     BendDaoApeStakingTracker,
 )
 from modules.portfolio.trackers.pendle_tracker import PendleTracker
-from web2.coingecko import CoinGecko
 from web2.telegram import TelegramBot
 from visualization import Canvas
 from visualization.color import get_pie_chart_color
@@ -68,15 +75,26 @@ class PortfolioModule:
         self.state = state
 
     async def take_snapshot(self, passphrase: str) -> None:
+        EVM.pin_blocks()
+        GMXOracle().pin_feed()
+        clear_coingecko_token_data()
         try:
             timestamp = int(time.time())
-            coingecko = CoinGecko(os.environ["COINGECKO_API_KEY"])
-            btc, eth, sol = await coingecko.get_token_data(
-                "bitcoin", "ethereum", "solana"
-            )
-            market_prices = {"BTC": btc, "ETH": eth, "SOL": sol}
             trackers = [tracker(self.state, passphrase) for tracker in self.trackers]
             await asyncio.gather(*[tracker.initialize() for tracker in trackers])
+            market_token_ids = ["bitcoin", "ethereum", "solana"]
+            await resolve_coingecko_token_data(
+                *market_token_ids,
+                *[
+                    token_id
+                    for tracker in trackers
+                    for token_id in tracker.get_coingecko_token_ids()
+                ],
+            )
+            btc, eth, sol = [
+                await coingecko_token_data(token_id) for token_id in market_token_ids
+            ]
+            market_prices = {"BTC": btc, "ETH": eth, "SOL": sol}
             all_modules_snapshots = await asyncio.gather(
                 *[
                     tracker.get_snapshot()
@@ -130,6 +148,11 @@ class PortfolioModule:
                 os.environ["SERVER_LOG_CHAT_ID"],
                 f"Error happend when taking snapshot, id: {error_id}",
             )
+        finally:
+            EVM.unpin_blocks()
+            GMXOracle().unpin_feed()
+            Bitcoin().clear_wallet_cache()
+            Binance.clear_cache()
 
     async def get_snapshot(self, index: str = "0") -> None:
         i = int(index)
@@ -147,15 +170,20 @@ class PortfolioModule:
 
     async def initialize_all_tables(self) -> None:
         existing_tables = await self.state.get_all_tables()
-        for table_name, table_schema in [
-            (self.snapshot_table_name, self.snapshot_table_schema),
-            (self.logs_table_name, self.logs_table_schema),
-        ] + [
-            (tracker.config_table_name, tracker.config_table_schema)
-            for tracker in self.trackers
-        ]:
-            if table_name not in existing_tables:
-                await self.state.write(Query.create_table(table_name, table_schema))
+        await asyncio.gather(
+            *[
+                self.state.write(Query.create_table(table_name, table_schema))
+                for table_name, table_schema in [
+                    (self.snapshot_table_name, self.snapshot_table_schema),
+                    (self.logs_table_name, self.logs_table_schema),
+                ]
+                + [
+                    (tracker.config_table_name, tracker.config_table_schema)
+                    for tracker in self.trackers
+                ]
+                if table_name not in existing_tables
+            ]
+        )
 
     async def visualize_portfolio(self) -> None:
         table = await self.state.read(
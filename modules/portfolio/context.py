@@ -1,6 +1,10 @@
+import asyncio
+
+from asyncio import Future
 from os import environ
 
 from decimal import Decimal
+from functools import cache
 
 from utils import GlobalContext
 from web2.coingecko import CoinGecko
@@ -11,23 +15,64 @@ from dapps.sky import SUSDS
 from dapps.resolv import get_rlp_price
 
 
-_coingecko_client = CoinGecko(environ["COINGECKO_API_KEY"])
-_lido = Lido()
-_jito = Jito()
-_maker = MakerDAO()
-_susds = SUSDS()
+_COINGECKO_BATCH_SIZE = 50
+
+_coingecko_token_data: dict[str, Future[tuple[Decimal, Decimal]]] = {}
+
+
+@cache
+def _coingecko_client() -> CoinGecko:
+    return CoinGecko(environ["COINGECKO_API_KEY"])
+
+
+def clear_coingecko_token_data() -> None:
+    _coingecko_token_data.clear()
+
+
+def _is_resolving(token_id: str, loop: asyncio.AbstractEventLoop) -> bool:
+    future = _coingecko_token_data.get(token_id)
+    return future is not None and future.get_loop() is loop
+
+
+async def resolve_coingecko_token_data(*token_ids: str) -> None:
+    loop = asyncio.get_running_loop()
+    futures = {
+        token_id: loop.create_future()
+        for token_id in sorted(set(token_ids))
+        if not _is_resolving(token_id, loop)
+    }
+    _coingecko_token_data.update(futures)
+    missing = list(futures)
+    try:
+        for i in range(0, len(missing), _COINGECKO_BATCH_SIZE):
+            batch = missing[i : i + _COINGECKO_BATCH_SIZE]
+            token_data = await _coingecko_client().get_token_data(*batch)
+            for token_id, data in zip(batch, token_data):
+                futures[token_id].set_result(data)
+    except BaseException as error:
+        for token_id, future in futures.items():
+            if not future.done():
+                future.set_exception(error)
+                future.exception()
+                if _coingecko_token_data.get(token_id) is future:
+                    del _coingecko_token_data[token_id]
+        raise
+
+
+async def coingecko_token_data(token_id: str) -> tuple[Decimal, Decimal]:
+    if not _is_resolving(token_id, asyncio.get_running_loop()):
+        await resolve_coingecko_token_data(token_id)
+    return await asyncio.shield(_coingecko_token_data[token_id])
 
 
-@GlobalContext.with_context
 async def coingecko_price(token_id: str) -> Decimal:
-    token_data = await _coingecko_client.get_token_data(token_id)
-    price, _ = token_data[0]
+    price, _ = await coingecko_token_data(token_id)
     return price
 
 
 @GlobalContext.with_context
 async def coingecko_nft_price(nft_id: str) -> Decimal:
-    return await _coingecko_client.get_nft_price(nft_id)
+    return await _coingecko_client().get_nft_price(nft_id)
 
 
 async def btc_price() -> Decimal:
@@ -44,22 +89,22 @@ async def sol_price() -> Decimal:
 
 @GlobalContext.with_context
 async def wsteth() -> Decimal:
-    return await _lido.steth_per_wsteth()
+    return await Lido().steth_per_wsteth()
 
 
 @GlobalContext.with_context
 async def jitosol() -> Decimal:
-    return await _jito.sol_per_jitosol()
+    return await Jito().sol_per_jitosol()
 
 
 @GlobalContext.with_context
 async def sdai() -> Decimal:
-    return await _maker.dai_per_sdai()
+    return await MakerDAO().dai_per_sdai()
 
 
 @GlobalContext.with_context
 async def susds() -> Decimal:
-    return await _susds.usds_per_susds()
+    return await SUSDS().usds_per_susds()
 
 
 @GlobalContext.with_context
@@ -1,37 +1,23 @@
-def _get_balances(
-    market_snapshot: dict[str, tuple[float, float]],
-    cash_percentage: float,
-    index_value: float,
-) -> dict[str, float]:
-    total_mc = sum([market_snapshot[asset][1] for asset in market_snapshot])
-    return {
-        "cash": index_value * cash_percentage,
-        **{
-            asset: market_snapshot[asset][1]
-            * (1 - cash_percentage)
-            * index_value
-            / total_mc
-            for asset in market_snapshot
-        },
-    }
+import numpy as np
+
+from modules.index_engine import RebalanceSchedule, market_cap_index
 
 
 def build_index(
-    market_prices: list[dict[str, tuple[float, float]]], cash_percentage: float
+    market_prices: list[dict[str, tuple[float, float]]],
+    cash_percentage: float,
+    schedule: RebalanceSchedule = 1,
+    verify: bool = False,
 ) -> list[float]:
-    index_values = [1.0]
-    balances = _get_balances(market_prices[0], cash_percentage, index_values[-1])
-    for i in range(1, len(market_prices)):
-        index_values.append(
-            balances["cash"]
-            + sum(
-                [
-                    balances["asset"]
-                    * (market_prices[i][asset][0] if asset in market_prices[i] else 0)
-                    for asset in balances
-                    if asset != "cash"
-                ]
-            )
-        )
-        balances = _get_balances(market_prices[0], cash_percentage, index_values[-1])
-    return index_values
+    assets = list(
+        dict.fromkeys([asset for snapshot in market_prices for asset in snapshot])
+    )
+    prices = np.full((len(market_prices), len(assets)), np.nan)
+    market_caps = np.full((len(market_prices), len(assets)), np.nan)
+    for i, snapshot in enumerate(market_prices):
+        for j, asset in enumerate(assets):
+            if asset in snapshot:
+                prices[i, j], market_caps[i, j] = snapshot[asset]
+    return market_cap_index(
+        prices, market_caps, cash_percentage, schedule, verify
+    ).tolist()
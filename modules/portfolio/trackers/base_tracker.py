@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from decimal import Decimal
+from typing import Any
 
 from state import RDS
 from state.sql import Query
@@ -7,9 +8,29 @@ from state.serializers import ColumnType
 from modules.portfolio.account import AccountCipher
 
 
+def _find_coingecko_token_ids(obj: Any) -> set[str]:
+    token_ids = set()
+    if isinstance(obj, dict):
+        for key in obj:
+            config = obj.get(f"{key}_config")
+            if (
+                key.endswith("price_reference")
+                and obj[key] == "CoinGecko"
+                and isinstance(config, dict)
+                and "token_id" in config
+            ):
+                token_ids.add(config["token_id"])
+            token_ids |= _find_coingecko_token_ids(obj[key])
+    elif isinstance(obj, list):
+        for value in obj:
+            token_ids |= _find_coingecko_token_ids(value)
+    return token_ids
+
+
 class BaseTracker:
     config_table_name: str
     config_table_schema: dict[str, ColumnType]
+    coingecko_token_ids: list[str] = []
 
     def __init__(self, state: RDS, passphrase: str) -> None:
         self.cipher = AccountCipher(passphrase)
@@ -18,5 +39,12 @@ class BaseTracker:
     async def initialize(self) -> None:
         self.config = await self.state.read(Query.get_table(self.config_table_name))
 
+    def get_coingecko_token_ids(self) -> set[str]:
+        if self.config.row_count == 0:
+            return set()
+        return set(self.coingecko_token_ids) | _find_coingecko_token_ids(
+            self.config.get_rows()
+        )
+
     @abstractmethod
     async def get_snapshot(self) -> tuple[Decimal, dict, dict, dict]: ...
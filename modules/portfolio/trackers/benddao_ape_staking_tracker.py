@@ -12,6 +12,7 @@ class BendDaoApeStakingTracker(BaseTracker):
         "nft_address": ColumnType.string,
         "token_id": ColumnType.integer,
     }
+    coingecko_token_ids = ["apecoin"]
 
     @property
     def staked_nfts(self) -> dict[str, list[int]]:
@@ -19,6 +19,7 @@ class GMXTracker(BaseTracker):
         "markets": ColumnType.json,
         "account": ColumnType.bytes,
     }
+    coingecko_token_ids = ["gmx"]
 
     def __init__(self, state: RDS, passphrase: str) -> None:
         super().__init__(state, passphrase)
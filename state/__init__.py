@@ -1,23 +1,82 @@
+import asyncio
+
+from asyncio import Task, TimerHandle
+
 from utils import CachedClass
 from state.api import APIGatewayClient
 from state.boto import BotoClient
+from state.sqlite import SQLiteClient
 from state.table import Table
 from state.sql import Query
+from state.serializers import StateDataType
 
 
 class RDS(metaclass=CachedClass):
-    def __init__(self, api_key: str | None = None) -> None:
-        if api_key:
+    _max_buffered_rows = 100
+    _max_buffer_delay = 1.0
+
+    def __init__(
+        self, api_key: str | None = None, database_path: str | None = None
+    ) -> None:
+        if database_path:
+            self.client = SQLiteClient(database_path)
+        elif api_key:
             self.client = APIGatewayClient(api_key)
         else:
             self.client = BotoClient()
+        self._buffer: dict[tuple[str, tuple[str, ...]], list[list]] = {}
+        self._flush_handle: TimerHandle | None = None
+        self._flush_tasks: set[Task] = set()
 
     async def get_all_tables(self) -> list[str]:
         return await self.client.get_all_tables()
 
     async def read(self, query: Query) -> Table:
-        columns, rows = await self.client.read(query)
+        await self.flush()
+        columns, rows = await self.client.read(query, query.params)
         return Table(columns, rows)
 
     async def write(self, query: Query) -> None:
-        await self.client.write(query)
+        await self.flush()
+        await self.client.write(query, query.params)
+
+    async def insert_row(
+        self, table_name: str, column_values: dict[str, StateDataType]
+    ) -> None:
+        key = (table_name, tuple(column_values))
+        self._buffer.setdefault(key, []).append(list(column_values.values()))
+        if len(self._buffer[key]) >= self._max_buffered_rows:
+            await self._flush_buffer()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self._max_buffer_delay, self._schedule_flush
+            )
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = None
+        task = asyncio.create_task(self._flush_buffer())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._on_flushed)
+
+    def _on_flushed(self, task: Task) -> None:
+        if not task.cancelled() and task.exception() is None:
+            self._flush_tasks.discard(task)
+
+    async def _flush_buffer(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        buffer, self._buffer = self._buffer, {}
+        for (table_name, columns), rows in buffer.items():
+            for i in range(0, len(rows), self._max_buffered_rows):
+                query = Query.insert_rows(
+                    table_name, list(columns), rows[i : i + self._max_buffered_rows]
+                )
+                await self.client.write(query, query.params)
+
+    async def flush(self) -> None:
+        await self._flush_buffer()
+        if self._flush_tasks:
+            tasks = list(self._flush_tasks)
+            self._flush_tasks.clear()
+            await asyncio.gather(*tasks)
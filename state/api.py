@@ -5,28 +5,47 @@ import hmac
 import hashlib
 
 from typing import Any
+from base64 import b64encode
 
 from clients.http import HTTPClient
 from utils import CachedClass
+from state.serializers import StateParameter
+from state.sql import inline_parameters
+
+
+def _encode_parameter(value: StateParameter) -> dict:
+    if isinstance(value, bytes):
+        return {"blob": b64encode(value).decode()}
+    else:
+        return {"value": value}
 
 
 class APIGatewayClient(HTTPClient, metaclass=CachedClass):
     _name = "RDS"
-    _base_url = os.environ["RDS_API_BASE_URL"]
+    _base_url = os.environ.get("RDS_API_BASE_URL", "")
+    _bound_parameters = os.environ.get("RDS_API_BOUND_PARAMETERS") == "1"
     _request_limit = 0.001
+    _burst = 20
+    _max_concurrency = 10
 
     def __init__(self, api_key: str) -> None:
         super().__init__()
         self._api_key = api_key
 
-    async def call(self, method: str, *args: str) -> dict:
-        data = json.dumps(
-            {
-                "method": method,
-                "args": list(args),
-                "timestamp": time.time(),
-            }
-        )
+    async def call(
+        self, method: str, *args: str, params: list[StateParameter] | None = None
+    ) -> dict:
+        payload: dict[str, Any] = {
+            "method": method,
+            "args": list(args),
+            "timestamp": time.time(),
+        }
+        if params:
+            if self._bound_parameters:
+                payload["params"] = [_encode_parameter(value) for value in params]
+            else:
+                payload["args"] = [inline_parameters(args[0], params), *args[1:]]
+        data = json.dumps(payload)
         signature = hmac.new(
             self._api_key.encode(), data.encode(), hashlib.sha256
         ).hexdigest()
@@ -42,9 +61,13 @@ class APIGatewayClient(HTTPClient, metaclass=CachedClass):
         response = await self.call("get_all_tables")
         return response["data"]
 
-    async def read(self, command: str) -> tuple[list[str], list[list[int | str]]]:
-        response = await self.call("read", command)
+    async def read(
+        self, command: str, params: list[StateParameter] | None = None
+    ) -> tuple[list[str], list[list[int | str]]]:
+        response = await self.call("read", command, params=params)
         return response["data"][0], response["data"][1]
 
-    async def write(self, command: str) -> None:
-        await self.call("write", command)
+    async def write(
+        self, command: str, params: list[StateParameter] | None = None
+    ) -> None:
+        await self.call("write", command, params=params)
@@ -1,8 +1,15 @@
+from state.serializers import StateParameter
+
+
 class BotoClient:
     def __init__(self) -> None: ...
 
     async def get_all_tables(self) -> list[str]: ...
 
-    async def read(self, command: str) -> tuple[list[str], list[list[int | str]]]: ...
+    async def read(
+        self, command: str, params: list[StateParameter] | None = None
+    ) -> tuple[list[str], list[list[int | str]]]: ...
 
-    async def write(self, command: str) -> None: ...
+    async def write(
+        self, command: str, params: list[StateParameter] | None = None
+    ) -> None: ...
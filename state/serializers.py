@@ -9,6 +9,8 @@ from exceptions import SerializationError
 
 StateDataType = bool | int | str | Decimal | list | dict | bytes
 
+StateParameter = int | str | bytes
+
 
 class ColumnType(StrEnum):
     bool = "CHAR(1)"
@@ -26,19 +28,11 @@ class BlobTypeCode(IntEnum):
     bytes = 3
 
 
-def serialize_bool(value: bool) -> str:
-    return "'1'" if value else "'0'"
-
-
-def serialize_integer(value: int) -> str:
-    return str(value)
-
+def blob_string(value: str) -> bytes:
+    return BlobTypeCode.string.to_bytes() + value.encode()
 
-def serialize_string(value: str) -> str:
-    return f"x'{(BlobTypeCode.string.to_bytes() + value.encode()).hex()}'"
 
-
-def serialize_decimal(value: Decimal) -> str:
+def blob_decimal(value: Decimal) -> bytes:
     left, right = value.as_integer_ratio()
     left_hex = hex(left)[2::]
     left_hex_padded = "0" * (len(left_hex) % 2) + left_hex
@@ -54,30 +48,44 @@ def serialize_decimal(value: Decimal) -> str:
         decimal_hex = (
             "0" * (right_length - left_length) + left_hex_padded + right_hex_padded
         )
-    return f"x'{BlobTypeCode.decimal.to_bytes().hex()}{decimal_hex}'"
+    return BlobTypeCode.decimal.to_bytes() + bytes.fromhex(decimal_hex)
+
 
+def blob_json(value: list | dict) -> bytes:
+    return BlobTypeCode.json.to_bytes() + json.dumps(value).encode()
 
-def serialize_json(value: list | dict) -> str:
-    return f"x'{(BlobTypeCode.json.to_bytes() + json.dumps(value).encode()).hex()}'"
 
+def blob_bytes(value: bytes) -> bytes:
+    return BlobTypeCode.bytes.to_bytes() + value
 
-def serialize_bytes(value: bytes) -> str:
-    return f"x'{(BlobTypeCode.bytes.to_bytes() + value).hex()}'"
+
+def to_blob(value: str | Decimal | list | dict | bytes) -> bytes:
+    if isinstance(value, str):
+        return blob_string(value)
+    elif isinstance(value, Decimal):
+        return blob_decimal(value)
+    elif isinstance(value, list) or isinstance(value, dict):
+        return blob_json(value)
+    else:
+        return blob_bytes(value)
 
 
-def serialize(value: StateDataType) -> str:
+def to_parameter(value: StateDataType) -> StateParameter:
     if isinstance(value, bool):
-        return serialize_bool(value)
+        return "1" if value else "0"
     elif isinstance(value, int):
-        return serialize_integer(value)
+        return value
+    else:
+        return to_blob(value)
+
+
+def serialize_parameter(value: StateParameter) -> str:
+    if isinstance(value, int):
+        return str(value)
     elif isinstance(value, str):
-        return serialize_string(value)
-    elif isinstance(value, Decimal):
-        return serialize_decimal(value)
-    elif isinstance(value, list) or isinstance(value, dict):
-        return serialize_json(value)
+        return f"'{value}'"
     else:
-        return serialize_bytes(value)
+        return f"x'{value.hex()}'"
 
 
 def deserialize_string(value: bytes) -> str:
@@ -1,31 +1,66 @@
 from __future__ import annotations
 
+from functools import cache
 from typing import Literal
 
-from state.serializers import serialize, StateDataType, ColumnType
+from exceptions import InvalidValue
+from state.serializers import (
+    to_parameter,
+    serialize_parameter,
+    StateDataType,
+    StateParameter,
+    ColumnType,
+)
+
+
+@cache
+def _placeholders(count: int) -> str:
+    return ", ".join(["?"] * count)
+
+
+@cache
+def _insert_template(table_name: str, columns: tuple[str, ...], row_count: int) -> str:
+    row = f"({_placeholders(len(columns))})"
+    return "INSERT INTO {} ({}) VALUES {}".format(
+        table_name, ", ".join(columns), ", ".join([row] * row_count)
+    )
+
+
+def inline_parameters(command: str, params: list[StateParameter]) -> str:
+    parts = command.split("?")
+    if len(parts) != len(params) + 1:
+        raise InvalidValue("query parameters", params)
+    return parts[0] + "".join(
+        [serialize_parameter(value) + part for value, part in zip(params, parts[1:])]
+    )
 
 
 class Query(str):
-    def __new__(cls, sql: str) -> Query:
-        return super().__new__(cls, sql)
+    params: list[StateParameter]
+
+    def __new__(cls, sql: str, params: list[StateParameter] | None = None) -> Query:
+        query = super().__new__(cls, sql)
+        query.params = params if params is not None else []
+        return query
+
+    def extend(self, sql: str, values: list[StateDataType] | None = None) -> Query:
+        return Query(
+            f"{self}{sql}",
+            self.params + [to_parameter(value) for value in values or []],
+        )
 
     @staticmethod
     def _get_statement(
         statement: Literal["WHERE", "SET"],
         key_value_pairs: dict[str, StateDataType] | None,
-    ) -> str:
+    ) -> tuple[str, list[StateParameter]]:
+        if not key_value_pairs:
+            return "", []
+        separator = " AND " if statement == "WHERE" else ", "
         return (
-            (
-                f" {statement} "
-                + " AND ".join(
-                    [
-                        f"{column} = {serialize(key_value_pairs[column])}"
-                        for column in key_value_pairs
-                    ]
-                )
-            )
-            if key_value_pairs
-            else ""
+            f" {statement} "
+            + separator.join([f"{column} = ?" for column in key_value_pairs]),
+            [to_parameter(key_value_pairs[column]) for column in key_value_pairs],
         )
 
     @staticmethod
@@ -38,15 +73,9 @@ class Query(str):
 
     @staticmethod
     def insert_row(table_name: str, column_values: dict[str, StateDataType]) -> Query:
-        columns = []
-        values = []
-        for column in column_values:
-            columns.append(column)
-            values.append(serialize(column_values[column]))
         return Query(
-            "INSERT INTO {} ({}) VALUES ({})".format(
-                table_name, ", ".join(columns), ", ".join(values)
-            )
+            _insert_template(table_name, tuple(column_values), 1),
+            [to_parameter(column_values[column]) for column in column_values],
         )
 
     @staticmethod
@@ -54,16 +83,8 @@ class Query(str):
         table_name: str, columns: list[str], rows: list[list[StateDataType]]
     ) -> Query:
         return Query(
-            "INSERT INTO {} ({}) VALUES {}".format(
-                table_name,
-                ", ".join(columns),
-                ", ".join(
-                    [
-                        "({})".format(", ".join([serialize(value) for value in row]))
-                        for row in rows
-                    ]
-                ),
-            )
+            _insert_template(table_name, tuple(columns), len(rows)),
+            [to_parameter(value) for row in rows for value in row],
         )
 
     @staticmethod
@@ -72,9 +93,12 @@ class Query(str):
         match_values: dict[str, StateDataType],
         new_values: dict[str, StateDataType],
     ) -> Query:
-        set_statement = Query._get_statement("SET", new_values)
-        where_statement = Query._get_statement("WHERE", match_values)
-        return Query(f"UPDATE {table_name}{set_statement}{where_statement}")
+        set_statement, set_params = Query._get_statement("SET", new_values)
+        where_statement, where_params = Query._get_statement("WHERE", match_values)
+        return Query(
+            f"UPDATE {table_name}{set_statement}{where_statement}",
+            set_params + where_params,
+        )
 
     @staticmethod
     def delete_table(table_name: str) -> Query:
@@ -93,18 +117,47 @@ class Query(str):
         order: Literal["ASC", "DESC"] = "ASC",
     ) -> Query:
         column_statement = ", ".join(columns)
-        where_statement = Query._get_statement("WHERE", match_values)
+        where_statement, params = Query._get_statement("WHERE", match_values)
         order_by_statement = f" ORDER BY {order_by} {order}" if order_by else ""
         return Query(
-            f"SELECT {column_statement} FROM {table_name}{where_statement}{order_by_statement}"
+            f"SELECT {column_statement} FROM {table_name}{where_statement}{order_by_statement}",
+            params,
         )
 
+    @staticmethod
+    def _get_in_statement(
+        column: str, values: list[StateDataType]
+    ) -> tuple[str, list[StateParameter]]:
+        return f" WHERE {column} IN ({_placeholders(len(values))})", [
+            to_parameter(value) for value in values
+        ]
+
+    @staticmethod
+    def get_rows_in(
+        table_name: str,
+        column: str,
+        values: list[StateDataType],
+        columns: list[str] | Literal["*"] = "*",
+    ) -> Query:
+        column_statement = ", ".join(columns)
+        in_statement, params = Query._get_in_statement(column, values)
+        return Query(
+            f"SELECT {column_statement} FROM {table_name}{in_statement}", params
+        )
+
+    @staticmethod
+    def delete_rows_in(
+        table_name: str, column: str, values: list[StateDataType]
+    ) -> Query:
+        in_statement, params = Query._get_in_statement(column, values)
+        return Query(f"DELETE FROM {table_name}{in_statement}", params)
+
     @staticmethod
     def delete_rows(
         table_name: str, match_values: dict[str, StateDataType] | None = None
     ) -> Query:
-        where_statement = Query._get_statement("WHERE", match_values)
-        return Query(f"DELETE FROM {table_name}{where_statement}")
+        where_statement, params = Query._get_statement("WHERE", match_values)
+        return Query(f"DELETE FROM {table_name}{where_statement}", params)
 
     @staticmethod
     def rename_table(table_name: str, new_table_name: str) -> Query:
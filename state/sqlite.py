@@ -0,0 +1,54 @@
+import re
+import sqlite3
+
+from base64 import b64encode
+
+from state.serializers import StateParameter
+
+
+_RENAME_TABLE = re.compile(r"^\s*RENAME TABLE (\w+) TO (\w+)\s*$", re.IGNORECASE)
+
+
+def _encode_value(value: int | str | bytes | None) -> int | str | None:
+    if isinstance(value, bytes):
+        return b64encode(value).decode()
+    else:
+        return value
+
+
+def _translate(command: str) -> str:
+    match = _RENAME_TABLE.match(command)
+    if match:
+        return f"ALTER TABLE {match.group(1)} RENAME TO {match.group(2)}"
+    else:
+        return command
+
+
+class SQLiteClient:
+    def __init__(self, database_path: str) -> None:
+        self.database_path = database_path
+        self.connection = sqlite3.connect(
+            database_path, isolation_level=None, cached_statements=256
+        )
+
+    def __repr__(self) -> str:
+        return f"<SQLiteClient {self.database_path}>"
+
+    async def get_all_tables(self) -> list[str]:
+        cursor = self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table'"
+        )
+        return [name for name, in cursor.fetchall()]
+
+    async def read(
+        self, command: str, params: list[StateParameter] | None = None
+    ) -> tuple[list[str], list[list[int | str]]]:
+        cursor = self.connection.execute(_translate(command), params or [])
+        columns = [column[0] for column in cursor.description]
+        rows = [[_encode_value(value) for value in row] for row in cursor.fetchall()]
+        return columns, rows  # type: ignore
+
+    async def write(
+        self, command: str, params: list[StateParameter] | None = None
+    ) -> None:
+        self.connection.execute(_translate(command), params or [])
@@ -32,15 +32,41 @@ def _display_value(value: Any, width: int) -> str:
 class Table:
     def __init__(self, columns: list[str], rows: list[list[int | str]]) -> None:
         self._columns = columns
-        self._rows = rows
+        self._row_count = len(rows)
+        self._raw_columns: list[list[int | str]] = (
+            [list(column) for column in zip(*rows)]
+            if rows
+            else [[] for _ in columns]
+        )
+        self._column_index: dict[str, int] = {}
+        for i, column in enumerate(columns):
+            self._column_index.setdefault(column, i)
+        self._decoded_columns: dict[int, list[StateDataType | None]] = {}
+
+    def _decode_column(self, index: int) -> list[StateDataType | None]:
+        if index not in self._decoded_columns:
+            self._decoded_columns[index] = [
+                deserialize(value) for value in self._raw_columns[index]
+            ]
+        return self._decoded_columns[index]
+
+    def _decode_row(self, row_index: int) -> list[StateDataType | None]:
+        return [
+            (
+                self._decoded_columns[i][row_index]
+                if i in self._decoded_columns
+                else deserialize(self._raw_columns[i][row_index])
+            )
+            for i in range(len(self._columns))
+        ]
 
     @cached_property
     def _displayed_rows(self) -> list[list[StateDataType | None]]:
         if self.row_count <= _MAX_ROW_NUM:
-            return [[i] + self.rows[i] for i in range(self.row_count)]
+            return [[i] + self._decode_row(i) for i in range(self.row_count)]
         else:
             return [
-                [i] + self.rows[i]
+                [i] + self._decode_row(i)
                 for i in [0, 1] + [self.row_count - 6 + j for j in range(6)]
             ]
 
@@ -105,29 +131,34 @@ class Table:
 
     @cached_property
     def rows(self) -> list[list[StateDataType | None]]:
-        return [[deserialize(value) for value in row] for row in self._rows]
+        decoded_columns = [self._decode_column(i) for i in range(len(self._columns))]
+        return [list(row) for row in zip(*decoded_columns)]
 
     @cached_property
     def row_count(self) -> int:
-        return len(self.rows)
+        return self._row_count
 
     @cached_property
     def column_count(self) -> int:
         return len(self.columns)
 
-    @cache
     def get_column(self, column_name: str) -> list[StateDataType | None]:
-        index = self.columns.index(column_name)
-        return [row[index] for row in self.rows]
+        if column_name not in self._column_index:
+            raise ValueError(f"{column_name} is not in table columns")
+        return self._decode_column(self._column_index[column_name])
 
     @cache
     def get_rows(
         self, rows: int | tuple[int, int] | Literal["all"] = "all"
     ) -> list[dict[str, StateDataType | None]]:
         if isinstance(rows, int):
-            target_rows = self.rows[rows : rows + 1]
+            target_rows = [
+                self._decode_row(i) for i in range(self.row_count)[rows : rows + 1]
+            ]
         elif isinstance(rows, tuple):
-            target_rows = self.rows[rows[0] : rows[1]]
+            target_rows = [
+                self._decode_row(i) for i in range(self.row_count)[rows[0] : rows[1]]
+            ]
         elif rows == "all":
             target_rows = self.rows
         return [
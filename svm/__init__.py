@@ -1,5 +1,3 @@
-import asyncio
-import random
 from decimal import Decimal
 
 from solana.rpc.async_api import AsyncClient
@@ -7,7 +5,9 @@ from construct import Struct
 from solders.pubkey import Pubkey  # type: ignore
 
 from utils import CachedClass
+from clients.scheduler import AdaptiveScheduler
 from svm.account import Account
+from svm.loader import AccountLoader
 from svm.token import SPLToken
 from svm.constants import SOLANA_HTTP_RPC_URL
 from exceptions import InvalidURL
@@ -18,6 +18,8 @@ class SVM(metaclass=CachedClass):
         if "://" not in rpc_url:
             raise InvalidURL()
         self.rpc = AsyncClient(rpc_url)
+        self.loader = AccountLoader(self.rpc)
+        self.scheduler = AdaptiveScheduler(rpc_url)
 
     def __repr__(self) -> str:
         protocol, uri = self.rpc._provider.endpoint_uri.split("://")
@@ -33,6 +35,7 @@ class SVM(metaclass=CachedClass):
         return token
 
     async def get_balance(self, account: str) -> Decimal:
-        await asyncio.sleep(random.uniform(0, 3))
-        response = await self.rpc.get_balance(Pubkey.from_string(account))
+        response = await self.scheduler.run(
+            self.rpc.get_balance, Pubkey.from_string(account)
+        )
         return Decimal(response.value) / Decimal(10**9)
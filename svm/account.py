@@ -1,12 +1,9 @@
-import asyncio
-import random
-
 from solana.rpc.async_api import AsyncClient
 from construct import Struct
-from solders.pubkey import Pubkey  # type: ignore
 
 from utils import CachedClass
 from svm.layout import parse
+from svm.loader import AccountLoader
 from exceptions import NotExistError
 
 
@@ -15,14 +12,14 @@ class Account(metaclass=CachedClass):
         self.rpc = rpc
         self.public_key = public_key
         self.construct = construct
+        self.loader = AccountLoader(rpc)
 
     def __repr__(self) -> str:
         return f"<Account {self.public_key}>"
 
     async def get_data(self) -> dict:
-        await asyncio.sleep(random.uniform(0, 3))
-        response = await self.rpc.get_account_info(Pubkey.from_string(self.public_key))
-        if response.value:
-            return parse(response.value.data, self.construct)
+        data = await self.loader.load(self.public_key)
+        if data is not None:
+            return parse(data, self.construct)
         else:
             raise NotExistError("account", self.public_key)
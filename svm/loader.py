@@ -0,0 +1,64 @@
+import asyncio
+
+from asyncio import Future, TimerHandle
+
+from solana.rpc.async_api import AsyncClient
+from solders.pubkey import Pubkey  # type: ignore
+
+from utils import CachedClass
+from clients.scheduler import AdaptiveScheduler
+
+
+class AccountLoader(metaclass=CachedClass):
+    def __init__(
+        self, rpc: AsyncClient, window: float = 0.02, max_batch_size: int = 100
+    ) -> None:
+        self.rpc = rpc
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.scheduler = AdaptiveScheduler(rpc._provider.endpoint_uri)
+        self._pending: dict[str, list[Future]] = {}
+        self._flush_handle: TimerHandle | None = None
+
+    def __repr__(self) -> str:
+        return f"<AccountLoader pending: {len(self._pending)}>"
+
+    async def load(self, public_key: str) -> bytes | None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if public_key in self._pending:
+            self._pending[public_key].append(future)
+        else:
+            self._pending[public_key] = [future]
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, {}
+        if len(batch) > 0:
+            asyncio.create_task(self._execute(batch))
+
+    async def _execute(self, batch: dict[str, list[Future]]) -> None:
+        public_keys = list(batch)
+        try:
+            response = await self.scheduler.run(
+                self.rpc.get_multiple_accounts,
+                [Pubkey.from_string(public_key) for public_key in public_keys],
+            )
+        except BaseException as error:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(error)
+            return
+        for public_key, account in zip(public_keys, response.value):
+            data = account.data if account else None
+            for future in batch[public_key]:
+                if not future.done():
+                    future.set_result(data)
@@ -1,11 +1,15 @@
 import os
 import json
+import time
+import marshal
+import asyncio
 import hashlib
 
 from abc import abstractmethod
-from asyncio import Event
+from asyncio import Event, Future
+from collections.abc import Mapping
 from decimal import Decimal
-from typing import Callable, Any
+from typing import Callable, Any, Iterator
 from string import ascii_lowercase
 
 from exceptions import NotInitializedError
@@ -82,16 +86,31 @@ class CachedClass(type):
 
 
 class InitializableClass:
+    _initialize_retry_delay: float = 1
+
     @abstractmethod
     async def _initialize(self) -> None: ...
 
-    async def initialize(self) -> None:
-        if not hasattr(self, "__initializer"):
-            self.__initializer = Event()
-            await self._initialize()
-            self.__initializer.set()
+    def _on_initialized(self, initializer: Future) -> None:
+        if initializer.cancelled() or initializer.exception() is not None:
+            self._initialize_retry_at = time.monotonic() + self._initialize_retry_delay
+
+    def _should_initialize(self) -> bool:
+        initializer: Future | None = getattr(self, "_initializer", None)
+        if initializer is None:
+            return True
+        elif not initializer.done():
+            return False
+        elif initializer.cancelled() or initializer.exception() is not None:
+            return time.monotonic() >= self._initialize_retry_at
         else:
-            await self.__initializer.wait()
+            return False
+
+    async def initialize(self) -> None:
+        if self._should_initialize():
+            self._initializer = asyncio.ensure_future(self._initialize())
+            self._initializer.add_done_callback(self._on_initialized)
+        await asyncio.shield(self._initializer)
 
 
 def initialized_property(attr: str) -> Callable:
@@ -115,6 +134,83 @@ def get_json_dictionary(path: str) -> dict:
     return data
 
 
+class LazyJSONDictionary(Mapping):
+    def __init__(self, path: str, bundle_path: str | None = None) -> None:
+        self._path = path
+        self._bundle_path = bundle_path
+        self._data: dict[str, Any] = {}
+        self._keys: list[str] | None = None
+        self._bundle_checked = False
+
+    def __repr__(self) -> str:
+        return f"<LazyJSONDictionary {self._path}>"
+
+    def _get_sources(self) -> dict[str, tuple[int, int]]:
+        sources = {}
+        for file in os.listdir(self._path):
+            if ".json" in file:
+                stat = os.stat(f"{self._path}{file}")
+                sources[file] = (stat.st_size, int(stat.st_mtime))
+        return sources
+
+    def _is_bundle_current(self, bundle: dict) -> bool:
+        sources = bundle.get("sources")
+        if not isinstance(sources, dict) or "data" not in bundle:
+            return False
+        current = self._get_sources()
+        if sources.keys() != current.keys():
+            return False
+        for file in sources:
+            size, mtime = sources[file]
+            current_size, current_mtime = current[file]
+            if size != current_size or abs(mtime - current_mtime) > 2:
+                return False
+        return True
+
+    def _load_bundle(self) -> None:
+        self._bundle_checked = True
+        if self._bundle_path and os.path.exists(self._bundle_path):
+            with open(self._bundle_path, mode="rb") as f:
+                bundle = marshal.load(f)
+            if not self._is_bundle_current(bundle):
+                return
+            self._keys = list(bundle["data"])
+            for key in bundle["data"]:
+                self._data.setdefault(key, bundle["data"][key])
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._data and not self._bundle_checked:
+            self._load_bundle()
+        if key not in self._data:
+            try:
+                with open(f"{self._path}{key}.json", mode="r") as f:
+                    self._data[key] = json.load(f)
+            except FileNotFoundError:
+                raise KeyError(key)
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        if self._keys is None:
+            self._keys = [
+                file.replace(".json", "")
+                for file in os.listdir(self._path)
+                if ".json" in file
+            ]
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(list(iter(self)))
+
+    def build_bundle(self) -> None:
+        if self._bundle_path:
+            bundle = {
+                "sources": self._get_sources(),
+                "data": get_json_dictionary(self._path),
+            }
+            with open(self._bundle_path, mode="wb") as f:
+                marshal.dump(bundle, f)
+
+
 def snake_to_camel(string: str) -> str:
     _string = string
     for char in ascii_lowercase:
@@ -1,19 +1,65 @@
+from __future__ import annotations
+
+import json
 import time
 import hmac
+import asyncio
 import hashlib
 
+from asyncio import Future, TimerHandle
 from decimal import Decimal
 from urllib.parse import urlencode
 
 from web2.cex.types import Candle
 from clients.http import HTTPClient
 from utils import CachedClass
+from exceptions import InvalidValue
+
+
+INTERVAL_MILLISECONDS = {
+    "1s": 1000,
+    "1m": 60 * 1000,
+    "3m": 3 * 60 * 1000,
+    "5m": 5 * 60 * 1000,
+    "15m": 15 * 60 * 1000,
+    "30m": 30 * 60 * 1000,
+    "1h": 60 * 60 * 1000,
+    "2h": 2 * 60 * 60 * 1000,
+    "4h": 4 * 60 * 60 * 1000,
+    "6h": 6 * 60 * 60 * 1000,
+    "8h": 8 * 60 * 60 * 1000,
+    "12h": 12 * 60 * 60 * 1000,
+    "1d": 24 * 60 * 60 * 1000,
+    "3d": 3 * 24 * 60 * 60 * 1000,
+    "1w": 7 * 24 * 60 * 60 * 1000,
+}
+
+
+def _parse_candle(candle: list) -> Candle:
+    return {
+        "timestamp": int(candle[0]),
+        "open": Decimal(candle[1]),
+        "high": Decimal(candle[2]),
+        "low": Decimal(candle[3]),
+        "close": Decimal(candle[4]),
+        "volume": Decimal(candle[5]),
+    }
 
 
 class Binance(HTTPClient, metaclass=CachedClass):
     _name = "Binance"
     _base_url = "https://api.binance.com"
     _request_limit = 0.1
+    _burst = 10
+    _price_batch_window = 0.05
+    _max_candles = 1000
+    _instances: list[Binance] = []
+
+    @staticmethod
+    def clear_cache() -> None:
+        for instance in Binance._instances:
+            instance._balances = None
+            instance._prices = {}
 
     def __init__(
         self, api_key: str | None = None, secret_key: str | None = None
@@ -21,6 +67,11 @@ class Binance(HTTPClient, metaclass=CachedClass):
         super().__init__()
         self._api_key = api_key
         self._secret_key = secret_key.encode() if secret_key else b""
+        self._balances: Future | None = None
+        self._prices: dict[str, Future] = {}
+        self._pending_prices: dict[str, Future] = {}
+        self._price_flush_handle: TimerHandle | None = None
+        Binance._instances.append(self)
 
     def _sign(self, params: dict) -> None:
         signature = hmac.new(
@@ -32,7 +83,7 @@ class Binance(HTTPClient, metaclass=CachedClass):
     def _headers(self) -> dict:
         return {"X-MBX-APIKEY": self._api_key}
 
-    async def get_all_balance(self) -> dict[str, Decimal]:
+    async def _get_all_balance(self) -> dict[str, Decimal]:
         params = {"timestamp": int(time.time() * 1000), "recvWindow": 6000}
         self._sign(params)
         data = await self._call(
@@ -44,18 +95,100 @@ class Binance(HTTPClient, metaclass=CachedClass):
             if Decimal(asset["free"]) + Decimal(asset["locked"]) > Decimal("0")
         }
 
+    async def get_all_balance(self) -> dict[str, Decimal]:
+        if self._balances is None:
+            self._balances = asyncio.ensure_future(self._get_all_balance())
+        balances = self._balances
+        try:
+            return await asyncio.shield(balances)
+        except BaseException:
+            if self._balances is balances:
+                self._balances = None
+            raise
+
     async def get_token_balance(self, token_ticker: str) -> Decimal:
         all_balance = await self.get_all_balance()
         return all_balance[token_ticker]
 
+    async def _get_prices(self, tickers: list[str]) -> dict[str, Decimal]:
+        if len(tickers) == 1:
+            data = [
+                await self._call(
+                    "get",
+                    endpoint="/api/v3/ticker/price",
+                    parameters={"symbol": tickers[0]},
+                )
+            ]
+        else:
+            data = await self._call(
+                "get",
+                endpoint="/api/v3/ticker/price",
+                parameters={"symbols": json.dumps(tickers, separators=(",", ":"))},
+            )
+        return {ticker["symbol"]: Decimal(ticker["price"]) for ticker in data}
+
+    def _flush_prices(self) -> None:
+        if self._price_flush_handle is not None:
+            self._price_flush_handle.cancel()
+            self._price_flush_handle = None
+        batch, self._pending_prices = self._pending_prices, {}
+        if len(batch) > 0:
+            asyncio.create_task(self._resolve_prices(batch))
+
+    async def _resolve_prices(self, batch: dict[str, Future]) -> None:
+        try:
+            prices = await self._get_prices(list(batch))
+        except BaseException as error:
+            if len(batch) == 1:
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(error)
+                return
+            results = await asyncio.gather(
+                *[self._get_prices([ticker]) for ticker in batch],
+                return_exceptions=True,
+            )
+            for ticker, result in zip(batch, results):
+                if batch[ticker].done():
+                    continue
+                if isinstance(result, BaseException):
+                    batch[ticker].set_exception(result)
+                elif ticker in result:
+                    batch[ticker].set_result(result[ticker])
+                else:
+                    batch[ticker].set_exception(KeyError(ticker))
+            return
+        for ticker in batch:
+            if ticker in prices:
+                batch[ticker].set_result(prices[ticker])
+            else:
+                batch[ticker].set_exception(KeyError(ticker))
+
     async def last_traded_price(self, ticker: str) -> Decimal:
-        data = await self._call(
-            "get", endpoint="/api/v3/ticker/price", parameters={"symbol": ticker}
-        )
-        return Decimal(data["price"])
+        if ticker not in self._prices:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._prices[ticker] = future
+            self._pending_prices[ticker] = future
+            if self._price_flush_handle is None:
+                self._price_flush_handle = loop.call_later(
+                    self._price_batch_window, self._flush_prices
+                )
+        price = self._prices[ticker]
+        try:
+            return await asyncio.shield(price)
+        except BaseException:
+            if self._prices.get(ticker) is price:
+                del self._prices[ticker]
+            raise
 
     async def get_candle_chart(
-        self, ticker: str, interval: str, start_time: int, end_time: int
+        self,
+        ticker: str,
+        interval: str,
+        start_time: int,
+        end_time: int,
+        limit: int = 500,
     ) -> list[Candle]:
         data = await self._call(
             "get",
@@ -65,16 +198,30 @@ class Binance(HTTPClient, metaclass=CachedClass):
                 "interval": interval,
                 "startTime": start_time,
                 "endTime": end_time,
+                "limit": limit,
             },
         )
-        return [
-            {
-                "timestamp": int(candle[0]),
-                "open": Decimal(candle[1]),
-                "high": Decimal(candle[2]),
-                "low": Decimal(candle[3]),
-                "close": Decimal(candle[4]),
-                "volume": Decimal(candle[5]),
-            }
-            for candle in data
-        ]
+        return list(map(_parse_candle, data))
+
+    async def download_candles(
+        self, ticker: str, interval: str, start_time: int, end_time: int
+    ) -> list[Candle]:
+        if interval not in INTERVAL_MILLISECONDS:
+            raise InvalidValue("interval", interval)
+        step = INTERVAL_MILLISECONDS[interval] * self._max_candles
+        windows = await asyncio.gather(
+            *[
+                self.get_candle_chart(
+                    ticker,
+                    interval,
+                    window_start,
+                    min(window_start + step - 1, end_time),
+                    limit=self._max_candles,
+                )
+                for window_start in range(start_time, end_time + 1, step)
+            ]
+        )
+        candles = {
+            candle["timestamp"]: candle for window in windows for candle in window
+        }
+        return [candles[timestamp] for timestamp in sorted(candles)]
@@ -0,0 +1,106 @@
+import time
+
+from state import RDS
+from state.sql import Query
+from state.serializers import ColumnType
+from web2.cex import get_cex
+from web2.cex.types import Candle
+from web2.cex.binance import INTERVAL_MILLISECONDS
+
+
+class CandleStore:
+    table_name = "cex_candles"
+    table_schema = {
+        "exchange": ColumnType.string,
+        "ticker": ColumnType.string,
+        "candle_interval": ColumnType.string,
+        "timestamp": ColumnType.integer,
+        "open": ColumnType.decimal,
+        "high": ColumnType.decimal,
+        "low": ColumnType.decimal,
+        "close": ColumnType.decimal,
+        "volume": ColumnType.decimal,
+    }
+    _insert_chunk_size = 500
+
+    def __init__(self, state: RDS, exchange: str = "binance") -> None:
+        self.state = state
+        self.exchange = exchange
+        self.cex = get_cex(exchange, {})
+
+    async def initialize_table(self) -> None:
+        all_tables = await self.state.get_all_tables()
+        if self.table_name not in all_tables:
+            await self.state.write(
+                Query.create_table(self.table_name, self.table_schema)
+            )
+
+    def _match_values(self, ticker: str, interval: str) -> dict:
+        return {"exchange": self.exchange, "ticker": ticker, "candle_interval": interval}
+
+    async def _get_latest_timestamp(self, ticker: str, interval: str) -> int | None:
+        query = Query.get_table(
+            self.table_name,
+            columns=["timestamp"],
+            match_values=self._match_values(ticker, interval),
+            order_by="timestamp",
+            order="DESC",
+        )
+        table = await self.state.read(query.extend(" LIMIT 1"))
+        return table.get_column("timestamp")[0] if table.row_count > 0 else None  # type: ignore
+
+    async def sync(
+        self, ticker: str, interval: str, start_time: int, end_time: int
+    ) -> int:
+        now = int(time.time() * 1000)
+        end_time = min(end_time, now - INTERVAL_MILLISECONDS[interval])
+        latest = await self._get_latest_timestamp(ticker, interval)
+        if latest is not None and latest >= start_time:
+            start_time = latest + INTERVAL_MILLISECONDS[interval]
+        if start_time > end_time:
+            return 0
+        candles = [
+            candle
+            for candle in await self.cex.download_candles(
+                ticker, interval, start_time, end_time
+            )
+            if candle["timestamp"] + INTERVAL_MILLISECONDS[interval] <= now
+        ]
+        columns = [column for column in self.table_schema]
+        rows = [
+            [
+                self.exchange,
+                ticker,
+                interval,
+                candle["timestamp"],
+                candle["open"],
+                candle["high"],
+                candle["low"],
+                candle["close"],
+                candle["volume"],
+            ]
+            for candle in candles
+        ]
+        for i in range(0, len(rows), self._insert_chunk_size):
+            await self.state.write(
+                Query.insert_rows(
+                    self.table_name, columns, rows[i : i + self._insert_chunk_size]  # type: ignore
+                )
+            )
+        return len(rows)
+
+    async def get_candles(
+        self, ticker: str, interval: str, start_time: int, end_time: int
+    ) -> list[Candle]:
+        query = Query.get_table(
+            self.table_name,
+            columns=["timestamp", "open", "high", "low", "close", "volume"],
+            match_values=self._match_values(ticker, interval),
+        )
+        table = await self.state.read(
+            query.extend(
+                " AND timestamp >= ? AND timestamp <= ? ORDER BY timestamp ASC",
+                [start_time, end_time],
+            )
+        )
+        return table.get_rows()  # type: ignore
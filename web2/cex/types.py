@@ -23,3 +23,8 @@ class CEXInterface(Protocol):
     async def get_candle_chart(
         self, ticker: str, interval: str, start_time: int, end_time: int
     ) -> list[Candle]: ...
+
+    @abstractmethod
+    async def download_candles(
+        self, ticker: str, interval: str, start_time: int, end_time: int
+    ) -> list[Candle]: ...
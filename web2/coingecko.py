@@ -1,3 +1,5 @@
+import hashlib
+
 from decimal import Decimal
 
 from clients.http import HTTPClient
@@ -8,11 +10,16 @@ class CoinGecko(HTTPClient, metaclass=CachedClass):
     _name = "CoinGecko"
     _base_url = "https://api.coingecko.com"
     _request_limit = 3.5
+    _burst = 3
 
     def __init__(self, api_key: str) -> None:
         super().__init__()
         self._api_key = api_key
 
+    @property
+    def _rate_limit_key(self) -> str:
+        return hashlib.sha256(self._api_key.encode()).hexdigest()[:12]
+
     @property
     def _headers(self) -> dict:
         return {"accept": "application/json", "x-cg-demo-api-key": self._api_key}